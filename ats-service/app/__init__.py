@@ -11,6 +11,11 @@ Architecture:
 - models/: Data schemas and response structures
 """
 
+import os
+import sys
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import nltk
@@ -19,7 +24,81 @@ from nltk.corpus import stopwords
 # Global configuration
 SBERT_ENABLED = False
 sbert_model = None
-STOP_WORDS = set()
+STOP_WORDS = frozenset()
+
+# SBERT is opt-in: set ATS_ENABLE_SBERT=1 to load the model at startup
+SBERT_MODEL_NAME = 'all-MiniLM-L6-v2'
+SBERT_OPT_IN = os.environ.get('ATS_ENABLE_SBERT', '').lower() in ('1', 'true', 'yes')
+# Optional directory with an ONNX export of the model (see services/onnx_encoder.py)
+SBERT_ONNX_PATH = os.environ.get('ATS_SBERT_ONNX')
+
+
+def _default_inference_threads() -> int:
+    """CPU threads per worker process for SBERT, at most 8 (see ATS_TORCH_THREADS)."""
+    workers = max(1, int(os.environ.get('ATS_WORKERS', '1')))
+    return max(1, min(8, (os.cpu_count() or 1) // workers))
+
+
+# Intra-op threads for SBERT inference on CPU. With several worker
+# processes, keep this at or below cpu_count / ATS_WORKERS.
+INFERENCE_THREADS = int(os.environ.get('ATS_TORCH_THREADS') or _default_inference_threads())
+
+# Worker threads available to sync route handlers (anyio's default is 40)
+THREADPOOL_SIZE = 64
+
+
+def load_sbert_model(model_name: str):
+    """
+    Load a SentenceTransformer model on the fastest available device.
+    
+    On a CUDA GPU the model is converted to FP16, which roughly halves memory
+    traffic with no meaningful change in similarity scores. On CPU, PyTorch
+    uses INFERENCE_THREADS threads per encode. A dummy encode warms up the
+    CUDA context so the first request doesn't pay for it.
+    
+    Args:
+        model_name (str): SentenceTransformer model name
+    
+    Returns:
+        SentenceTransformer: Loaded model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+    
+    torch.set_num_threads(INFERENCE_THREADS)
+    try:
+        # One request's encode is a single op graph; inter-op threads only contend
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already set, or torch has run parallel work in this process
+        pass
+    
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    model = SentenceTransformer(model_name, device=device)
+    if device == 'cuda':
+        model = model.half()
+    
+    model.encode(['warmup'], convert_to_numpy=True)
+    print(f"SBERT model {model_name} loaded on {device}")
+    return model
+
+
+def load_onnx_sbert_model(model_dir: str):
+    """
+    Load an ONNX export of the SBERT model for CPU inference.
+    
+    Args:
+        model_dir (str): Directory with the exported (optionally INT8) model
+    
+    Returns:
+        ONNXSentenceEncoder: Encoder with a SentenceTransformer-style encode()
+    """
+    from app.services.onnx_encoder import ONNXSentenceEncoder
+    
+    model = ONNXSentenceEncoder(model_dir, num_threads=INFERENCE_THREADS)
+    model.encode(['warmup'])
+    print(f"SBERT ONNX model loaded from {model_dir}")
+    return model
 
 
 def initialize_nlp_resources():
@@ -37,23 +116,48 @@ def initialize_nlp_resources():
     try:
         # Download stopwords if not already present
         nltk.download('stopwords', quiet=True)
-        STOP_WORDS = set(stopwords.words('english'))
+        STOP_WORDS = frozenset(stopwords.words('english'))
         
-        # SBERT model loading disabled on Windows due to Numpy compatibility issues
-        print("SBERT model loading disabled on Windows (Numpy compatibility)")
-        sbert_model = None
-        SBERT_ENABLED = False
+        if not SBERT_OPT_IN:
+            print("SBERT model loading disabled (set ATS_ENABLE_SBERT=1 to enable)")
+            sbert_model = None
+            SBERT_ENABLED = False
+        elif sys.platform == 'win32':
+            # SBERT model loading disabled on Windows due to Numpy compatibility issues
+            print("SBERT model loading disabled on Windows (Numpy compatibility)")
+            sbert_model = None
+            SBERT_ENABLED = False
+        else:
+            try:
+                if SBERT_ONNX_PATH:
+                    sbert_model = load_onnx_sbert_model(SBERT_ONNX_PATH)
+                else:
+                    sbert_model = load_sbert_model(SBERT_MODEL_NAME)
+                SBERT_ENABLED = True
+            except Exception as e:
+                print(f"Warning: Could not load SBERT model: {e}")
+                print("Falling back to TF-IDF similarity")
+                sbert_model = None
+                SBERT_ENABLED = False
         
     except Exception as e:
         print(f"Warning: Could not initialize SBERT model: {e}")
         print("Falling back to TF-IDF similarity")
-        STOP_WORDS = set()
+        STOP_WORDS = frozenset()
         sbert_model = None
         SBERT_ENABLED = False
     
     return sbert_model, SBERT_ENABLED, STOP_WORDS
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Runs once per worker around serving requests."""
+    # Parsing/scoring handlers are sync and run in anyio's thread pool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
 def create_app() -> FastAPI:
     """
     Factory function to create and configure the FastAPI application.
@@ -62,7 +166,8 @@ def create_app() -> FastAPI:
     1. Creates a FastAPI instance
     2. Configures CORS middleware for cross-origin requests
     3. Initializes NLP resources
-    4. Registers all routes
+    4. Sizes the thread pool used by sync route handlers
+    5. Registers all routes
     
     Returns:
         FastAPI: Configured FastAPI application instance
@@ -71,7 +176,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="ATS Service with TF-IDF",
         description="Resume parsing and scoring service for Applicant Tracking System",
-        version="2.0.0"
+        version="2.0.0",
+        lifespan=_lifespan
     )
     
     # Configure CORS - allows frontend to communicate with this service
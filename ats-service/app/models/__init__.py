@@ -10,6 +10,7 @@ from app.models.response_schema import (
     ModelInfo,
     ParsedSections,
     ATSScoreResponse,
+    ATSBatchScoreResponse,
     SimilarityResponse,
     DetailedSimilarityResponse,
     HealthResponse,
@@ -22,6 +23,7 @@ __all__ = [
     'ModelInfo',
     'ParsedSections',
     'ATSScoreResponse',
+    'ATSBatchScoreResponse',
     'SimilarityResponse',
     'DetailedSimilarityResponse',
     'HealthResponse',
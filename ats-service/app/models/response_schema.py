@@ -63,7 +63,7 @@ class ATSScoreResponse(BaseModel):
     This is the main response returned by the /parse endpoint.
     It contains everything needed to understand the resume analysis.
     """
-    rawText: str = Field(..., description="Full text extracted from resume")
+    rawText: Optional[str] = Field(None, description="Full text extracted from resume (only when include_raw_text is set)")
     parsedSkills: List[str] = Field(default_factory=list, description="List of skills extracted")
     parsingErrors: List[str] = Field(default_factory=list, description="Errors encountered during parsing")
     atsScore: float = Field(..., description="Final ATS score (0-100)")
@@ -110,6 +110,26 @@ class ATSScoreResponse(BaseModel):
         }
 
 
+class ATSBatchScoreResponse(BaseModel):
+    """
+    Response for the /parse_batch endpoint.
+    
+    Contains one ATSScoreResponse-shaped result per uploaded file,
+    in upload order, each tagged with the original filename.
+    """
+    results: List[Dict[str, Any]] = Field(default_factory=list, description="Per-file ATS results (with filename)")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "results": [
+                    {"filename": "alice.pdf", "atsScore": 85.5, "parsedSkills": ["Python", "React"]},
+                    {"filename": "bob.docx", "atsScore": 72.1, "parsedSkills": ["Java"]}
+                ]
+            }
+        }
+
+
 class SimilarityResponse(BaseModel):
     """
     Response for similarity calculation endpoints.
@@ -157,13 +177,15 @@ class HealthResponse(BaseModel):
     status: str = Field("ok", description="Service status")
     sbert_enabled: bool = Field(False, description="Whether SBERT is enabled")
     model: str = Field("TF-IDF", description="Active model name")
+    device: Optional[str] = Field(None, description="Device SBERT runs on (None without SBERT)")
     
     class Config:
         schema_extra = {
             "example": {
                 "status": "ok",
                 "sbert_enabled": False,
-                "model": "TF-IDF"
+                "model": "TF-IDF",
+                "device": None
             }
         }
 
@@ -14,22 +14,30 @@ Key Responsibilities:
 Available Endpoints:
 - GET  /health: Service health check
 - POST /parse: Parse and score a resume
+- POST /parse_batch: Parse and score many resumes against one job description
 - POST /semantic-similarity: Calculate similarity between two texts
 - POST /similarity: Direct similarity calculation (with metadata)
+
+Parsing and scoring are CPU-bound and blocking, so these handlers are plain
+`def` functions: FastAPI runs them in its thread pool instead of on the
+event loop, and one slow upload no longer stalls every other request.
 """
 
 from fastapi import APIRouter, UploadFile, File, Form
-from typing import Optional, Dict, Any
-import traceback
+from typing import Optional, Dict, Any, List
+import hashlib
+import logging
 
-from app.services.parser import safe_extract_text, find_section, extract_contact_info
+from app.services.parser import safe_extract_text, split_sections, extract_contact_info, RESUME_SECTIONS
 from app.services.extractor import extract_skills_from_section, extract_skills_from_resume
 from app.services.scorer import (
     ats_similarity_score_sbert,
+    ats_similarity_score_sbert_batch,
     compute_heuristics,
     normalize_score,
     generate_white_box_feedback
 )
+from app.utils.cache import LRUCache
 
 # Import global configuration from app package
 import app
@@ -37,6 +45,68 @@ import app
 # Create router
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# Uploads larger than this are rejected before any parsing work runs
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Recent /parse results, keyed by file content + job description
+PARSE_CACHE_SIZE = 512
+_parse_cache = LRUCache(maxsize=PARSE_CACHE_SIZE)
+
+
+def _read_upload(file: UploadFile) -> Optional[bytes]:
+    """
+    Read an uploaded file in chunks, giving up once it exceeds MAX_UPLOAD_SIZE.
+    
+    Returns:
+        Optional[bytes]: File contents, or None if the file is too large
+    """
+    buf = bytearray()
+    while True:
+        chunk = file.file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return bytes(buf)
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_SIZE:
+            return None
+
+
+def _file_too_large(filename: str) -> Dict[str, Any]:
+    """Error response for an upload over MAX_UPLOAD_SIZE."""
+    return {
+        'error': 'File too large',
+        'detail': f'{filename} exceeds the {MAX_UPLOAD_SIZE // (1024 * 1024)} MB upload limit'
+    }
+
+
+def _parse_cache_key(data: bytes, filename: str, job_description: Optional[str]) -> tuple:
+    """
+    Build the cache key for a /parse request.
+    
+    The file extension is part of the key because it decides which parser
+    runs. Content is hashed so large uploads never sit in the key itself.
+    """
+    extension = filename.rsplit('.', 1)[-1].lower()
+    return (
+        hashlib.blake2b(data, digest_size=16).digest(),
+        extension,
+        hashlib.blake2b((job_description or '').encode('utf-8'), digest_size=16).digest()
+    )
+
+
+def _with_raw_text(result: Dict[str, Any], include_raw_text: bool) -> Dict[str, Any]:
+    """
+    Return the response for a parse result, dropping rawText unless requested.
+    
+    The extracted text is often tens of kilobytes and most clients never read
+    it. Cached results keep it, so a later request can still ask for it.
+    """
+    if include_raw_text:
+        return result
+    return {**result, 'rawText': None}
+
 
 @router.get('/health')
 def health() -> Dict[str, Any]:
@@ -44,7 +114,8 @@ def health() -> Dict[str, Any]:
     Health check endpoint.
     
     This endpoint is used to verify that the service is running and
-    to check which similarity model is active (SBERT or TF-IDF).
+    to check which similarity model is active (SBERT or TF-IDF), and on
+    which device SBERT runs (e.g. "cuda:0" or "cpu").
     
     Returns:
         dict: Service status and model information
@@ -53,20 +124,27 @@ def health() -> Dict[str, Any]:
         {
             "status": "ok",
             "sbert_enabled": false,
-            "model": "TF-IDF"
+            "model": "TF-IDF",
+            "device": null
         }
     """
+    device = None
+    if app.SBERT_ENABLED and app.sbert_model is not None:
+        device = str(getattr(app.sbert_model, 'device', 'cpu'))
+    
     return {
         'status': 'ok',
         'sbert_enabled': app.SBERT_ENABLED,
-        'model': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
+        'model': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF',
+        'device': device
     }
 
 
 @router.post('/parse')
-async def parse_resume(
+def parse_resume(
     file: UploadFile = File(...),
-    job_description: Optional[str] = Form(None)
+    job_description: Optional[str] = Form(None),
+    include_raw_text: bool = Form(False)
 ) -> Dict[str, Any]:
     """
     Parse and score a resume file.
@@ -82,6 +160,8 @@ async def parse_resume(
     Args:
         file (UploadFile): Resume file (PDF or DOCX)
         job_description (str, optional): Job description text for relevance scoring
+        include_raw_text (bool): Return the extracted text as "rawText"
+            (null by default to keep responses small)
     
     Returns:
         dict: Complete ATS analysis including score, breakdown, and feedback
@@ -100,100 +180,203 @@ async def parse_resume(
         }
     """
     try:
-        # Step 1: Read file bytes
-        data = await file.read()
-        
-        # Step 2: Extract text from file (PDF or DOCX)
-        raw_text, parsing_errors = safe_extract_text(data, file.filename)
+        # Step 1: Read file bytes (rejecting oversized uploads)
+        data = _read_upload(file)
+        if data is None:
+            return _file_too_large(file.filename)
         
-        # Step 3: Parse resume sections
-        parsed = {}
+        # Identical resume + job description: reuse the previous result
+        cache_key = _parse_cache_key(data, file.filename, job_description)
+        result = _parse_cache.get(cache_key)
+        if result is None:
+            result = _parse_impl(data, file.filename, job_description)
+            _parse_cache.set(cache_key, result)
         
-        # Extract skills section
-        skills_section = find_section(
-            raw_text,
-            ['skills', 'technical skills', 'skills & technologies']
-        )
-        parsed['skills'] = extract_skills_from_section(skills_section)
-        
-        # Also extract skills from full resume (used for scoring)
-        all_skills = extract_skills_from_resume(raw_text)
-        
-        # Extract education section
-        parsed['education'] = find_section(
-            raw_text,
-            ['education', 'academic', 'qualifications']
-        )
-        
-        # Extract experience section
-        parsed['experience'] = find_section(
-            raw_text,
-            ['experience', 'work experience', 'professional experience', 'employment']
-        )
-        
-        # Step 4: Compute heuristic score (resume structure quality)
-        heur_score, heur_feedback, heur_breakdown = compute_heuristics(
+        return _with_raw_text(result, include_raw_text)
+    
+    except Exception as e:
+        # Log error and return error response
+        logger.exception('Failed to parse %s', file.filename)
+        return {
+            'error': 'Failed to parse',
+            'detail': str(e)
+        }
+
+
+def _parse_impl(data: bytes, filename: str, job_description: Optional[str]) -> Dict[str, Any]:
+    """
+    Run the full parsing and scoring pipeline on an uploaded file.
+    
+    Args:
+        data (bytes): Raw bytes of the uploaded file
+        filename (str): Original filename (used to determine file type)
+        job_description (str, optional): Job description text for relevance scoring
+    
+    Returns:
+        dict: Complete ATS analysis (see parse_resume for the structure)
+    """
+    # Step 2: Extract text from file (PDF or DOCX)
+    raw_text, parsing_errors = safe_extract_text(data, filename)
+    
+    # Step 3: Compute relevance score (if job description provided)
+    relevance = None
+    if job_description:
+        relevance = ats_similarity_score_sbert(
             raw_text,
-            parsed,
-            parsing_errors
+            job_description,
+            sbert_model=app.sbert_model,
+            sbert_enabled=app.SBERT_ENABLED,
+            stop_words=app.STOP_WORDS
         )
+    
+    return _analyze_resume(raw_text, parsing_errors, relevance)
+
+
+def _analyze_resume(raw_text: str, parsing_errors: List[str],
+                    relevance: Optional[float]) -> Dict[str, Any]:
+    """
+    Parse sections, score and build the response for extracted resume text.
+    
+    Shared by /parse and /parse_batch; relevance is computed by the caller
+    so the batch endpoint can score all resumes in one go.
+    
+    Args:
+        raw_text (str): Text extracted from the resume file
+        parsing_errors (List[str]): Errors reported by the text extractor
+        relevance (float, optional): Similarity to the job description, or None
+    
+    Returns:
+        dict: Complete ATS analysis (see parse_resume for the structure)
+    """
+    # Lowercase once; skill matching and heuristics both need it
+    text_lower = raw_text.lower()
+    
+    # Step 4: Parse resume sections (skills, education, experience)
+    sections = split_sections(raw_text, RESUME_SECTIONS)
+    parsed = {}
+    parsed['skills'] = extract_skills_from_section(sections['skills'])
+    
+    # Also extract skills from full resume (used for scoring and parsedSkills)
+    all_skills = extract_skills_from_resume(raw_text, text_lower)
+    
+    parsed['education'] = sections['education']
+    parsed['experience'] = sections['experience']
+    
+    # Step 5: Compute heuristic score (resume structure quality)
+    heur_score, heur_feedback, heur_breakdown = compute_heuristics(
+        raw_text,
+        parsed,
+        parsing_errors,
+        text_lower,
+        all_skills
+    )
+    
+    # Step 6: Normalize final score (0-100)
+    final_score, norm_breakdown = normalize_score(heur_score, relevance)
+    
+    # Step 7: Extract contact information
+    contact = extract_contact_info(raw_text)
+    
+    # Step 8: Generate detailed feedback
+    feedback = generate_white_box_feedback(
+        heur_feedback,
+        relevance if relevance is not None else 0.0,
+        parsed,
+        contact,
+        {**heur_breakdown, **norm_breakdown},
+        sbert_enabled=app.SBERT_ENABLED
+    )
+    
+    # Step 9: Build response
+    result = {
+        'rawText': raw_text,
+        'parsedSkills': all_skills,  # Use full resume skills (matches scoring)
+        'parsingErrors': parsing_errors,
+        'atsScore': final_score,
+        'breakdown': {**heur_breakdown, **norm_breakdown},
+        'feedback': feedback,
+        'contact': contact,
+        'similarity_method': 'SBERT' if app.SBERT_ENABLED else 'TF-IDF',
+        'model_info': {
+            'sbert_enabled': app.SBERT_ENABLED,
+            'model_name': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
+        }
+    }
+    
+    return result
+
+
+@router.post('/parse_batch')
+def parse_resume_batch(
+    files: List[UploadFile] = File(...),
+    job_description: Optional[str] = Form(None),
+    include_raw_text: bool = Form(False)
+) -> Dict[str, Any]:
+    """
+    Parse and score several resume files against one job description.
+    
+    Produces the same analysis as /parse for every file, but computes
+    relevance for all resumes together: with SBERT, the job description and
+    all resumes are encoded in a single batched call; with TF-IDF, every
+    text is tokenized once and all resumes are scored with sparse matrix
+    products.
+    
+    Args:
+        files (List[UploadFile]): Resume files (PDF or DOCX)
+        job_description (str, optional): Job description text for relevance scoring
+        include_raw_text (bool): Return each file's extracted text as "rawText"
+    
+    Returns:
+        dict: {"results": [...]} with one /parse-style result per file,
+        in upload order, each including its "filename"
+    
+    Example Response:
+        {
+            "results": [
+                {"filename": "alice.pdf", "atsScore": 85.5, ...},
+                {"filename": "bob.docx", "atsScore": 72.1, ...}
+            ]
+        }
+    """
+    try:
+        # Step 1: Read every file (rejecting oversized uploads), then extract text
+        uploads = []
+        for f in files:
+            data = _read_upload(f)
+            if data is None:
+                return _file_too_large(f.filename)
+            uploads.append(data)
+        extracted = [safe_extract_text(data, f.filename) for data, f in zip(uploads, files)]
         
-        # Step 5: Compute relevance score (if job description provided)
-        relevance = None
+        # Step 2: Score relevance for all resumes at once
+        relevances = [None] * len(files)
         if job_description:
-            relevance = ats_similarity_score_sbert(
-                raw_text,
+            relevances = ats_similarity_score_sbert_batch(
+                [raw_text for raw_text, _ in extracted],
                 job_description,
                 sbert_model=app.sbert_model,
                 sbert_enabled=app.SBERT_ENABLED,
                 stop_words=app.STOP_WORDS
             )
         
-        # Step 6: Normalize final score (0-100)
-        final_score, norm_breakdown = normalize_score(heur_score, relevance)
-        
-        # Step 7: Extract contact information
-        contact = extract_contact_info(raw_text)
+        # Step 3: Analyze each resume
+        results = []
+        for f, (raw_text, parsing_errors), relevance in zip(files, extracted, relevances):
+            result = _analyze_resume(raw_text, parsing_errors, relevance)
+            results.append({'filename': f.filename, **_with_raw_text(result, include_raw_text)})
         
-        # Step 8: Generate detailed feedback
-        feedback = generate_white_box_feedback(
-            heur_feedback,
-            relevance if relevance is not None else 0.0,
-            parsed,
-            contact,
-            {**heur_breakdown, **norm_breakdown},
-            sbert_enabled=app.SBERT_ENABLED
-        )
-        
-        # Step 9: Build response
-        result = {
-            'rawText': raw_text,
-            'parsedSkills': all_skills,  # Use full resume skills (matches scoring)
-            'parsingErrors': parsing_errors,
-            'atsScore': final_score,
-            'breakdown': {**heur_breakdown, **norm_breakdown},
-            'feedback': feedback,
-            'contact': contact,
-            'similarity_method': 'SBERT' if app.SBERT_ENABLED else 'TF-IDF',
-            'model_info': {
-                'sbert_enabled': app.SBERT_ENABLED,
-                'model_name': 'all-MiniLM-L6-v2' if app.SBERT_ENABLED else 'TF-IDF'
-            }
-        }
-        
-        return result
+        return {'results': results}
     
     except Exception as e:
-        # Log error and return error response
-        traceback.print_exc()
+        logger.exception('Failed to parse batch of %d files', len(files))
         return {
-            'error': 'Failed to parse',
+            'error': 'Failed to parse batch',
             'detail': str(e)
         }
 
 
 @router.post('/semantic-similarity')
-async def semantic_similarity(
+def semantic_similarity(
     text1: str = Form(...),
     text2: str = Form(...)
 ) -> Dict[str, Any]:
@@ -234,7 +417,7 @@ async def semantic_similarity(
         }
     
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('Failed to calculate similarity')
         return {
             'error': 'Failed to calculate similarity',
             'detail': str(e),
@@ -243,7 +426,7 @@ async def semantic_similarity(
 
 
 @router.post('/similarity')
-async def calculate_similarity(
+def calculate_similarity(
     resume_text: str = Form(...),
     job_description: str = Form(...)
 ) -> Dict[str, Any]:
@@ -288,7 +471,7 @@ async def calculate_similarity(
         }
     
     except Exception as e:
-        traceback.print_exc()
+        logger.exception('Failed to calculate similarity')
         return {
             'error': 'Failed to calculate similarity',
             'detail': str(e)
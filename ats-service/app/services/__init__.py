@@ -8,8 +8,11 @@ Contains all core functionality for parsing, extraction, and scoring.
 from app.services.parser import (
     safe_extract_text,
     find_section,
+    split_sections,
+    RESUME_SECTIONS,
     extract_contact_info,
-    extract_text_from_docx_bytes
+    extract_text_from_docx_bytes,
+    extract_text_from_pdf_bytes
 )
 
 from app.services.extractor import (
@@ -19,11 +22,25 @@ from app.services.extractor import (
     deduplicate_skills
 )
 
+from app.services.tfidf_cache import (
+    fit_vectorizer,
+    get_vectorizer
+)
+
+from app.services.onnx_encoder import (
+    ONNXSentenceEncoder,
+    quantize_onnx_model
+)
+
 from app.services.scorer import (
     compute_relevance_tfidf,
+    compute_relevance_tfidf_batch,
     ats_similarity_score_sbert,
+    ats_similarity_score_sbert_batch,
     compute_heuristics,
+    score_skills_batch,
     normalize_score,
+    normalize_score_batch,
     generate_white_box_feedback
 )
 
@@ -31,8 +48,11 @@ __all__ = [
     # Parser
     'safe_extract_text',
     'find_section',
+    'split_sections',
+    'RESUME_SECTIONS',
     'extract_contact_info',
     'extract_text_from_docx_bytes',
+    'extract_text_from_pdf_bytes',
     
     # Extractor
     'extract_skills_from_section',
@@ -40,10 +60,22 @@ __all__ = [
     'normalize_skill',
     'deduplicate_skills',
     
+    # TF-IDF cache
+    'fit_vectorizer',
+    'get_vectorizer',
+    
+    # ONNX encoder
+    'ONNXSentenceEncoder',
+    'quantize_onnx_model',
+    
     # Scorer
     'compute_relevance_tfidf',
+    'compute_relevance_tfidf_batch',
     'ats_similarity_score_sbert',
+    'ats_similarity_score_sbert_batch',
     'compute_heuristics',
+    'score_skills_batch',
     'normalize_score',
+    'normalize_score_batch',
     'generate_white_box_feedback'
 ]
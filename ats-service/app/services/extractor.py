@@ -12,11 +12,18 @@ Key Responsibilities:
 """
 
 import re
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional
+
+# pyahocorasick is an optional accelerator for the resume-wide skill scan.
+# Without it we fall back to a single precompiled regex.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 # Comprehensive list of technical skills and technologies
-KNOWN_SKILLS: Set[str] = {
+KNOWN_SKILLS: FrozenSet[str] = frozenset({
     # Programming Languages
     'python', 'java', 'javascript', 'typescript', 'c', 'c++', 'c#', 'go', 'golang',
     'rust', 'ruby', 'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'lua',
@@ -83,7 +90,95 @@ KNOWN_SKILLS: Set[str] = {
     'apache', 'iis', 'rabbitmq', 'zeromq', 'celery', 'cron', 'systemd',
     'embedded', 'iot', 'raspberry pi', 'arduino', 'mqtt', 'blockchain', 'solidity',
     'web3', 'rust', 'wasm', 'webassembly', 'electron', 'tauri', 'pwa',
-}
+})
+
+
+def _build_skill_automaton():
+    """
+    Build an Aho-Corasick automaton over all KNOWN_SKILLS.
+    
+    The automaton finds every occurrence of every skill in a single pass
+    over the text, instead of running one regex search per skill.
+    
+    Returns:
+        ahocorasick.Automaton or None: Automaton keyed by skill, or None if
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for skill in KNOWN_SKILLS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import time and shared by every request
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+
+def _is_word_char(ch: str) -> bool:
+    """Return True for characters matched by regex \\w (letters, digits, underscore)."""
+    return ch.isalnum() or ch == '_'
+
+
+def _has_word_boundary(text: str, pos: int) -> bool:
+    """
+    Check whether a regex word boundary (\\b) exists at the given position.
+    
+    A boundary exists where a word character meets a non-word character
+    (or the start/end of the text).
+    """
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _build_skill_pattern() -> re.Pattern:
+    """
+    Compile all KNOWN_SKILLS into one alternation regex.
+    
+    The alternation is wrapped in a lookahead so overlapping skills are still
+    found (e.g. "google cloud" inside "google cloud platform"). Longer skills
+    are listed first, so at each position the longest matching skill wins.
+    
+    Returns:
+        re.Pattern: Pattern whose group 1 is the matched (lowercase) skill
+    """
+    ordered = sorted(KNOWN_SKILLS, key=len, reverse=True)
+    return re.compile(r'(?=\b(' + '|'.join(re.escape(s) for s in ordered) + r')\b)')
+
+
+def _build_skill_prefixes() -> dict:
+    """
+    Map each skill to the shorter skills that also match wherever it matches.
+    
+    When "react native" matches, "react" matches at the same position too,
+    but the regex only reports the longest skill per position. These prefixes
+    are the skills that end on a word boundary inside the longer skill.
+    
+    Returns:
+        dict: skill -> list of shorter skills implied by a match of skill
+    """
+    prefixes = {}
+    for skill in KNOWN_SKILLS:
+        prefixes[skill] = [
+            other for other in KNOWN_SKILLS
+            if len(other) < len(skill)
+            and skill.startswith(other)
+            and _has_word_boundary(skill, len(other))
+        ]
+    return prefixes
+
+
+# Fallback used when pyahocorasick is not installed (compiled once)
+_SKILL_PATTERN = _build_skill_pattern()
+_SKILL_PREFIXES = _build_skill_prefixes()
+
+
+# Runs of text between skills-section delimiters
+_SKILL_TOKEN_RE = re.compile(r'[^\n,;•\u2022|]+')
 
 
 def extract_skills_from_section(section_text: Optional[str]) -> List[str]:
@@ -97,7 +192,7 @@ def extract_skills_from_section(section_text: Optional[str]) -> List[str]:
     - Semicolons: "Python; Java; JavaScript"
     
     This function:
-    1. Splits the section by common delimiters
+    1. Finds the tokens between common delimiters
     2. Cleans up each skill (removes whitespace)
     3. Filters out invalid entries (too short or too long)
     
@@ -117,30 +212,57 @@ def extract_skills_from_section(section_text: Optional[str]) -> List[str]:
     if not section_text:
         return []
     
-    # Split by common delimiters:
+    # Find tokens between common delimiters:
     # - Newlines (\n)
     # - Commas (,)
     # - Semicolons (;)
     # - Bullet points (• or \u2022)
     # - Pipes (|)
-    tokens = re.split(r'[\n,;•\u2022|]+', section_text)
+    tokens = _SKILL_TOKEN_RE.findall(section_text)
     
-    skills = []
-    for t in tokens:
-        # Clean up whitespace
-        s = t.strip()
-        
-        # Filter: skill should be between 2 and 60 characters
-        # This removes:
-        # - Single characters (likely noise)
-        # - Very long strings (likely full sentences, not skills)
-        if 2 <= len(s) <= 60:
-            skills.append(s)
+    # Filter: skill should be between 2 and 60 characters
+    # This removes:
+    # - Single characters (likely noise)
+    # - Very long strings (likely full sentences, not skills)
+    stripped = (t.strip() for t in tokens)
+    skills = [s for s in stripped if 2 <= len(s) <= 60]
     
     return skills
 
 
-def extract_skills_from_resume(text: str) -> List[str]:
+class _OriginalSlicer:
+    """
+    Slice the original text using offsets found in its lowercased copy.
+    
+    str.lower() can change the length of a string ('İ' lowers to 'i' plus a
+    combining dot), after which offsets into the lowercased text no longer
+    line up with the original. In that case offsets are mapped back through
+    a per-character table, built only when needed.
+    """
+    
+    def __init__(self, text: str, text_lower: str):
+        self.text = text
+        self.text_lower = text_lower
+        self._index = None
+        if len(text) != len(text_lower):
+            # Original index of each character of the lowercased text
+            self._index = [
+                i for i, ch in enumerate(text) for _ in range(len(ch.lower()))
+            ]
+            if len(self._index) != len(text_lower):
+                # text_lower is not text.lower(); fall back to lowercase slices
+                self._index = []
+    
+    def slice(self, start: int, end: int) -> str:
+        """Original text for text_lower[start:end]."""
+        if self._index is None:
+            return self.text[start:end]
+        if not self._index:
+            return self.text_lower[start:end]
+        return self.text[self._index[start]:self._index[end - 1] + 1]
+
+
+def extract_skills_from_resume(text: str, text_lower: Optional[str] = None) -> List[str]:
     """
     Extract technical skills from the ENTIRE resume text.
     
@@ -151,6 +273,7 @@ def extract_skills_from_resume(text: str) -> List[str]:
     
     Args:
         text (str): Full resume text
+        text_lower (str, optional): text.lower(), if the caller already has it
     
     Returns:
         List[str]: List of unique skills found (original casing)
@@ -163,21 +286,40 @@ def extract_skills_from_resume(text: str) -> List[str]:
         return []
     
     found_skills = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    original = _OriginalSlicer(text, text_lower)
     
-    # Find all known skills mentioned in the text
-    for skill in KNOWN_SKILLS:
-        # Use word boundary matching to avoid partial matches
-        # e.g., "react" shouldn't match "reaction"
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            # Get the original casing from the text if possible
-            match = re.search(pattern, text_lower)
-            if match:
-                # Find the matching text in original case
-                start, end = match.start(), match.end()
-                original_skill = text[start:end]
-                found_skills.append(original_skill)
+    # Only the first occurrence of each skill is kept, like one re.search()
+    # per skill
+    seen = set()
+    
+    if _SKILL_AUTOMATON is not None:
+        # Single pass over the text finds every occurrence of every skill
+        for end_idx, skill in _SKILL_AUTOMATON.iter(text_lower):
+            if skill in seen:
+                continue
+            start, end = end_idx - len(skill) + 1, end_idx + 1
+            
+            # Same word boundary rule as r'\b' + skill + r'\b', so that
+            # "react" doesn't match "reaction"
+            if _has_word_boundary(text_lower, start) and _has_word_boundary(text_lower, end):
+                seen.add(skill)
+                # Keep the original casing from the text
+                found_skills.append(original.slice(start, end))
+        
+        return deduplicate_skills(found_skills)
+    
+    # Fallback: one regex scan reports the longest skill at each position
+    for match in _SKILL_PATTERN.finditer(text_lower):
+        skill = match.group(1)
+        start = match.start()
+        
+        # Shorter skills matching at the same position (e.g. "react" in "react native")
+        for matched in (skill, *_SKILL_PREFIXES[skill]):
+            if matched not in seen:
+                seen.add(matched)
+                found_skills.append(original.slice(start, start + len(matched)))
     
     # Deduplicate while preserving order
     return deduplicate_skills(found_skills)
@@ -0,0 +1,149 @@
+"""
+Fast Two-Document TF-IDF
+
+This module computes TF-IDF cosine similarities of resumes and a job
+description without fitting a TfidfVectorizer per pair.
+
+When no pre-fitted vectorizer is configured, the scorer fits
+TfidfVectorizer(stop_words='english') on just the resume and the job
+description. With only two documents a term's smoothed IDF is either
+ln(3 / 3) + 1 = 1 (both texts contain it) or ln(3 / 2) + 1 (only one does),
+so term counts are all that is needed. For one pair that is two term-count
+dicts, which skips sklearn's per-call validation, vocabulary sorting and
+sparse matrix construction; for many resumes it is one count matrix over
+all texts.
+
+Key Responsibilities:
+- Tokenize exactly like TfidfVectorizer's default analyzer
+- Compute the two-document TF-IDF cosine in the same floating-point order
+- Score many resumes against one job description from a single count matrix
+"""
+
+import math
+import re
+from typing import Dict, List
+
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
+
+# TfidfVectorizer's default token_pattern
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+# Smoothed IDF of a term only one of the two documents contains
+_IDF_ONE_DOC = float(np.log(1.5)) + 1.0
+
+
+def term_counts(text: str) -> Dict[str, int]:
+    """
+    Count terms the way TfidfVectorizer(stop_words='english') does.
+    
+    Args:
+        text (str): Raw text
+    
+    Returns:
+        Dict[str, int]: Term -> count, in order of first appearance
+    """
+    counts = {}
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token not in ENGLISH_STOP_WORDS:
+            counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
+def _unit_weights(counts: Dict[str, int], other: Dict[str, int], order) -> Dict[str, float]:
+    """
+    TF-IDF row as the original scorer computed it: TfidfVectorizer's L2
+    normalization followed by cosine_similarity()'s second one, with squares
+    summed in the given term order like sklearn's sparse code.
+    """
+    weights = [counts[term] * (1.0 if term in other else _IDF_ONE_DOC) for term in order]
+    for _ in range(2):
+        total = 0.0
+        for weight in weights:
+            total += weight * weight
+        if total == 0.0:
+            break
+        norm = math.sqrt(total)
+        weights = [weight / norm for weight in weights]
+    return dict(zip(order, weights))
+
+
+def tfidf_pair_cosine(job_text: str, resume_text: str) -> float:
+    """
+    TF-IDF cosine similarity of two texts, as if a
+    TfidfVectorizer(stop_words='english') had been fitted on just them.
+    
+    Reproduces TfidfVectorizer.fit_transform followed by
+    cosine_similarity(): both normalizations and the sums run in the same
+    order as sklearn's sparse code, so the result is the same float.
+    
+    Args:
+        job_text (str): Job description text (first document)
+        resume_text (str): Resume text (second document)
+    
+    Returns:
+        float: Similarity score between 0.0 and 1.0
+    
+    Example:
+        >>> tfidf_pair_cosine("Looking for Python developer",
+        ...                   "Python developer with 5 years experience")
+        0.41
+    """
+    job = term_counts(job_text or '')
+    resume = term_counts(resume_text or '')
+    
+    if job.keys().isdisjoint(resume):
+        return 0.0
+    
+    # sklearn stores the job row in first-appearance order and the resume
+    # row with the job's terms first
+    job_weights = _unit_weights(job, resume, job)
+    resume_order = [term for term in job if term in resume]
+    resume_order.extend(term for term in resume if term not in job)
+    resume_weights = _unit_weights(resume, job, resume_order)
+    
+    # The sparse product walks the job row in stored order; only shared
+    # terms contribute
+    total = 0.0
+    for term in job:
+        if term in resume:
+            total += job_weights[term] * resume_weights[term]
+    return total
+
+
+def tfidf_batch_cosines(resume_texts: List[str], job_text: str) -> np.ndarray:
+    """
+    TF-IDF cosine of each resume with the job description, as if a
+    TfidfVectorizer(stop_words='english') had been fitted on just that pair.
+    
+    Every pair is scored from one count matrix over all texts: shared terms
+    are weighted count * 1 and all other terms count * _IDF_ONE_DOC.
+    
+    Args:
+        resume_texts (List[str]): Full text of each resume
+        job_text (str): Job description text
+    
+    Returns:
+        np.ndarray: Cosine similarity per resume
+    """
+    docs = [text or '' for text in resume_texts] + [job_text or '']
+    counts = CountVectorizer(stop_words='english').fit_transform(docs).astype(np.float64).tocsr()
+    resumes, job = counts[:-1], counts[-1]
+    resumes_sq = resumes.multiply(resumes).tocsr()
+    job_sq = job.multiply(job).tocsr()
+    idf_sq = _IDF_ONE_DOC ** 2
+    
+    # Only shared terms contribute to the dot product, both with IDF 1
+    dot = (resumes @ job.T).toarray().ravel()
+    
+    # Squared norms: shared terms at IDF 1, the rest at _IDF_ONE_DOC
+    resume_total = np.asarray(resumes_sq.sum(axis=1)).ravel()
+    resume_shared = (resumes_sq @ job.sign().T).toarray().ravel()
+    job_total = job_sq.sum()
+    job_shared = (resumes.sign() @ job_sq.T).toarray().ravel()
+    resume_norm = np.sqrt(resume_shared + idf_sq * (resume_total - resume_shared))
+    job_norm = np.sqrt(job_shared + idf_sq * (job_total - job_shared))
+    
+    # An empty row has cosine 0
+    denom = resume_norm * job_norm
+    return np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0)
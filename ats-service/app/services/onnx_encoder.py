@@ -0,0 +1,156 @@
+"""
+ONNX Sentence Encoder
+
+This module runs an exported SBERT model with ONNX Runtime instead of
+PyTorch. With dynamic INT8 quantization this is several times faster on
+CPU, where SBERT encoding is the most expensive part of scoring.
+
+Export and quantize a model once:
+    optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \\
+        --task feature-extraction sbert_onnx/
+    python -c "from app.services.onnx_encoder import quantize_onnx_model; \\
+        quantize_onnx_model('sbert_onnx/model.onnx', 'sbert_onnx/model_int8.onnx')"
+
+then start the service with ATS_ENABLE_SBERT=1 ATS_SBERT_ONNX=sbert_onnx.
+
+Key Responsibilities:
+- Quantize an exported ONNX model to INT8
+- Tokenize, run and mean-pool like SentenceTransformer.encode()
+
+onnxruntime and transformers are only imported when an encoder is created.
+"""
+
+import os
+from typing import List
+
+import numpy as np
+
+# Default file names inside an exported model directory
+ONNX_MODEL_FILE = 'model.onnx'
+ONNX_INT8_MODEL_FILE = 'model_int8.onnx'
+
+# all-MiniLM-L6-v2 truncates input at 256 word pieces
+MAX_SEQ_LENGTH = 256
+
+
+def quantize_onnx_model(model_path: str, output_path: str) -> None:
+    """
+    Quantize an exported ONNX model's weights to INT8.
+    
+    Args:
+        model_path (str): Exported FP32 model (e.g. sbert_onnx/model.onnx)
+        output_path (str): Where to write the quantized model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+
+
+class ONNXSentenceEncoder:
+    """
+    Drop-in replacement for the SentenceTransformer.encode() calls the
+    scorer makes, backed by an ONNX Runtime session on CPU.
+    
+    Example:
+        >>> encoder = ONNXSentenceEncoder('sbert_onnx')
+        >>> encoder.encode(['Python developer'], normalize_embeddings=True).shape
+        (1, 384)
+    """
+    
+    def __init__(self, model_dir: str, model_file: str = None,
+                 max_seq_length: int = MAX_SEQ_LENGTH, num_threads: int = 0):
+        """
+        Args:
+            model_dir (str): Directory with the exported model and tokenizer
+            model_file (str, optional): Model file in model_dir; defaults to
+                the INT8 model if present, else the FP32 export
+            max_seq_length (int): Longest input, in word pieces
+            num_threads (int): Intra-op threads (0 = ONNX Runtime default)
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        
+        if model_file is None:
+            model_file = ONNX_INT8_MODEL_FILE
+            if not os.path.exists(os.path.join(model_dir, model_file)):
+                model_file = ONNX_MODEL_FILE
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, model_file),
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_seq_length = max_seq_length
+        self.device = 'cpu'
+        
+        self._input_names = {inp.name for inp in self.session.get_inputs()}
+        output_names = [out.name for out in self.session.get_outputs()]
+        # sentence-similarity exports already pool; feature-extraction
+        # exports return token embeddings, pooled here
+        self._pooled = 'sentence_embedding' in output_names
+        self._output_name = 'sentence_embedding' if self._pooled else output_names[0]
+    
+    def encode(self, sentences: List[str], batch_size: int = 32,
+               convert_to_numpy: bool = True, normalize_embeddings: bool = False,
+               show_progress_bar: bool = False) -> np.ndarray:
+        """
+        Encode sentences to embeddings, like SentenceTransformer.encode().
+        
+        Sentences are sorted by length before batching so each batch pads
+        to similar lengths; results are returned in input order.
+        
+        Args:
+            sentences (List[str]): Texts to encode
+            batch_size (int): Texts per forward pass
+            convert_to_numpy (bool): Accepted for compatibility (always NumPy)
+            normalize_embeddings (bool): L2-normalize each embedding
+            show_progress_bar (bool): Accepted for compatibility (ignored)
+        
+        Returns:
+            np.ndarray: len(sentences) x dim float32 embeddings
+        """
+        order = sorted(range(len(sentences)), key=lambda i: -len(sentences[i]))
+        embeddings = [None] * len(sentences)
+        
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            encoded = self._encode_batch([sentences[i] for i in batch])
+            for i, emb in zip(batch, encoded):
+                embeddings[i] = emb
+        
+        if not embeddings:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        result = np.stack(embeddings).astype(np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(result, axis=1, keepdims=True)
+            result = result / np.maximum(norms, 1e-12)
+        return result
+    
+    def _encode_batch(self, sentences: List[str]) -> np.ndarray:
+        """Run one padded batch through the model and pool it."""
+        tokens = self.tokenizer(
+            sentences,
+            padding=True,
+            truncation=True,
+            max_length=self.max_seq_length,
+            return_tensors='np'
+        )
+        feed = {
+            name: tokens[name].astype(np.int64)
+            for name in self._input_names if name in tokens
+        }
+        if 'token_type_ids' in self._input_names and 'token_type_ids' not in feed:
+            feed['token_type_ids'] = np.zeros_like(feed['input_ids'])
+        output = self.session.run([self._output_name], feed)[0]
+        
+        if self._pooled:
+            return output
+        
+        # Mean pooling over real (non-padding) tokens
+        mask = tokens['attention_mask'][..., None].astype(output.dtype)
+        return (output * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
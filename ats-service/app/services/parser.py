@@ -5,26 +5,141 @@ This module handles the extraction of text from resume files (PDF, DOCX).
 It is responsible for reading binary file data and converting it to plain text.
 
 Key Responsibilities:
-- Read PDF files and extract text
-- Read DOCX files and extract text
+- Read PDF files and extract text (PyMuPDF when installed, pdfminer otherwise)
+- Read DOCX files and extract text (streamed XML, python-docx as fallback)
 - Handle parsing errors gracefully
 - Return both extracted text and any errors encountered
 """
 
 import io
-from typing import Tuple, List, Optional
+import zipfile
+from typing import Tuple, List, Optional, Dict
 import re
 
 from pdfminer.high_level import extract_text as extract_text_from_pdf
 import docx
 
+# lxml streams word/document.xml for DOCX extraction. python-docx normally
+# pulls it in, but it is used directly only as an accelerator: without it
+# DOCX files go through python-docx alone.
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# PyMuPDF wraps the MuPDF C library and extracts text far faster than
+# pdfminer's pure-Python parser. It is optional; pdfminer is the fallback.
+# Newer releases install it as ``pymupdf``; older ones only provide ``fitz``.
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+
+
+def extract_text_from_pdf_bytes(data: bytes) -> str:
+    """
+    Extract text from a PDF file provided as bytes.
+    
+    Uses PyMuPDF if available, reading blocks in visual order (top-to-bottom,
+    left-to-right) so headers and their content stay on separate lines.
+    Otherwise falls back to pdfminer.
+    
+    Args:
+        data (bytes): Raw bytes of a PDF file
+    
+    Returns:
+        str: Extracted text from all pages
+    
+    Raises:
+        Exception: If the file cannot be parsed as a valid PDF
+    """
+    if fitz is None:
+        # pdfminer expects a file-like object, so wrap bytes in BytesIO
+        return extract_text_from_pdf(io.BytesIO(data))
+    
+    with fitz.open(stream=data, filetype='pdf') as doc:
+        return '\n'.join(page.get_text('text', sort=True) for page in doc)
+
+
+# WordprocessingML namespace used by word/document.xml
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_R = _W_NS + 'r'
+_W_HYPERLINK = _W_NS + 'hyperlink'
+_W_T = _W_NS + 't'
+_W_BR = _W_NS + 'br'
+_W_TYPE = _W_NS + 'type'
+
+# Text equivalents of run content elements (same mapping as python-docx)
+_W_RUN_CHARS = {
+    _W_NS + 'tab': '\t',
+    _W_NS + 'ptab': '\t',
+    _W_NS + 'cr': '\n',
+    _W_NS + 'noBreakHyphen': '-',
+}
+
+
+def _docx_run_text(run) -> str:
+    """Text of a single <w:r> element."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or '')
+        elif tag == _W_BR:
+            # Line breaks become newlines; page and column breaks are dropped
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _W_RUN_CHARS:
+            parts.append(_W_RUN_CHARS[tag])
+    return ''.join(parts)
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of a <w:p> element, including runs nested in hyperlinks."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_docx_run_text(run) for run in child if run.tag == _W_R)
+    return ''.join(parts)
+
+
+def _stream_docx_text(data: bytes) -> str:
+    """
+    Extract body paragraph text by streaming word/document.xml.
+    
+    Produces the same text as python-docx's ``Document.paragraphs`` without
+    building its object model. Each paragraph is freed once read.
+    """
+    paragraphs = []
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        with archive.open('word/document.xml') as xml_file:
+            for _, element in etree.iterparse(xml_file, events=('end',), tag=_W_P,
+                                              resolve_entities=False):
+                parent = element.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+                paragraphs.append(_docx_paragraph_text(element))
+                element.clear()
+                # Drop already-processed siblings so memory stays flat
+                while element.getprevious() is not None:
+                    del parent[0]
+    return '\n'.join(paragraphs)
+
 
 def extract_text_from_docx_bytes(data: bytes) -> str:
     """
     Extract text from a DOCX file provided as bytes.
     
-    DOCX files are actually ZIP archives containing XML files. The python-docx
-    library handles this complexity and extracts the text content.
+    DOCX files are actually ZIP archives containing XML files. With lxml the
+    paragraph text is streamed straight out of word/document.xml; without it,
+    or if that fails, the python-docx library parses the document instead.
     
     Args:
         data (bytes): Raw bytes of a DOCX file
@@ -35,20 +150,22 @@ def extract_text_from_docx_bytes(data: bytes) -> str:
     Raises:
         Exception: If the file cannot be parsed as a valid DOCX
     """
-    try:
-        # Create a Document object from bytes
-        doc = docx.Document(io.BytesIO(data))
-        
-        # Extract text from all paragraphs
-        full_text = []
-        for para in doc.paragraphs:
-            full_text.append(para.text)
-        
-        # Join paragraphs with newlines
-        return '\n'.join(full_text)
-    
-    except Exception:
-        raise
+    if etree is not None:
+        try:
+            return _stream_docx_text(data)
+        except Exception:
+            pass
+    
+    # Create a Document object from bytes
+    doc = docx.Document(io.BytesIO(data))
+    
+    # Extract text from all paragraphs
+    full_text = []
+    for para in doc.paragraphs:
+        full_text.append(para.text)
+    
+    # Join paragraphs with newlines
+    return '\n'.join(full_text)
 
 
 def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]:
@@ -86,8 +203,7 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
         # Handle PDF files
         if lower.endswith('.pdf'):
             try:
-                # pdfminer expects a file-like object, so wrap bytes in BytesIO
-                text = extract_text_from_pdf(io.BytesIO(file_bytes))
+                text = extract_text_from_pdf_bytes(file_bytes)
             except Exception as e:
                 errors.append(f'PDF parsing error: {str(e)}')
         
@@ -111,6 +227,44 @@ def safe_extract_text(file_bytes: bytes, filename: str) -> Tuple[str, List[str]]
     return text, errors
 
 
+# Common section headers to detect and split in preprocess_pdf_text
+SECTION_KEYWORDS = [
+    'Experience',
+    'Education',
+    'Skills',
+    'Technical Skills',
+    'Projects',
+    'Certifications',
+    'Leadership',
+    'Extracurriculars',
+    'Achievements',
+    'Hackathon',
+    'Summary',
+    'Objective',
+    'Work Experience',
+    'Professional Experience',
+]
+
+# Sections parsed from every resume: key -> names that may introduce the section
+RESUME_SECTIONS = {
+    'skills': ['skills', 'technical skills', 'skills & technologies'],
+    'education': ['education', 'academic', 'qualifications'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment'],
+}
+
+# Lowercased headers used by find_section to detect where a section ends
+SECTION_HEADERS = tuple(k.lower() for k in SECTION_KEYWORDS)
+
+# One alternation over all keywords (longest first) so the text is scanned
+# twice in total instead of twice per keyword. Lookarounds keep adjacent
+# headers like "EducationSkills" from consuming each other's context.
+_SECTION_KEYWORD_ALT = '|'.join(
+    re.escape(k) for k in sorted(SECTION_KEYWORDS, key=len, reverse=True)
+)
+_SECTION_BEFORE_RE = re.compile(r'(?<=\w)(?=' + _SECTION_KEYWORD_ALT + r')', re.IGNORECASE)
+_SECTION_AFTER_RE = re.compile(r'(' + _SECTION_KEYWORD_ALT + r')(?=[A-Z][a-z])', re.IGNORECASE)
+
+
 def preprocess_pdf_text(text: str) -> str:
     """
     Preprocess PDF text to fix common extraction issues.
@@ -129,34 +283,13 @@ def preprocess_pdf_text(text: str) -> str:
     # Replace form feed characters with newlines
     processed = text.replace('\x0c', '\n')
     
-    # Common section headers to detect and split
-    section_keywords = [
-        'Experience',
-        'Education', 
-        'Skills',
-        'Technical Skills',
-        'Projects',
-        'Certifications',
-        'Leadership',
-        'Extracurriculars',
-        'Achievements',
-        'Hackathon',
-        'Summary',
-        'Objective',
-        'Work Experience',
-        'Professional Experience',
-    ]
-    
-    for keyword in section_keywords:
-        # Insert newline BEFORE section headers preceded by non-space (word) characters
-        # Handles cases like: "content.SkillsPython" -> "content.\nSkillsPython"
-        pattern_before = r'(\w)(' + re.escape(keyword) + r')'
-        processed = re.sub(pattern_before, r'\1\n\2', processed, flags=re.IGNORECASE)
-        
-        # Insert newline AFTER section headers followed directly by word characters
-        # Handles cases like: "SkillsPython" -> "Skills\nPython"
-        pattern_after = r'(' + re.escape(keyword) + r')([A-Z][a-z])'
-        processed = re.sub(pattern_after, r'\1\n\2', processed, flags=re.IGNORECASE)
+    # Insert newline BEFORE section headers preceded by non-space (word) characters
+    # Handles cases like: "content.SkillsPython" -> "content.\nSkillsPython"
+    processed = _SECTION_BEFORE_RE.sub('\n', processed)
+    
+    # Insert newline AFTER section headers followed directly by word characters
+    # Handles cases like: "SkillsPython" -> "Skills\nPython"
+    processed = _SECTION_AFTER_RE.sub(r'\1\n', processed)
     
     return processed
 
@@ -184,25 +317,75 @@ def find_section(text: str, section_names: List[str]) -> Optional[str]:
         'BS Computer Science'
     """
     # Preprocess text to handle merged section headers
-    processed_text = preprocess_pdf_text(text)
-    lines = processed_text.splitlines()
+    lines = preprocess_pdf_text(text).splitlines()
+    lowered = [ln.strip().lower() for ln in lines]
+    return _find_section_in_lines(lines, lowered, section_names)
+
+
+def split_sections(text: str, section_map: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+    """
+    Extract several sections from resume text in one go.
+    
+    Equivalent to calling find_section once per entry of section_map, but the
+    text is preprocessed and split into lines only once.
+    
+    Args:
+        text (str): Full resume text
+        section_map (Dict[str, List[str]]): Section key -> possible names for
+            that section (e.g., RESUME_SECTIONS)
+    
+    Returns:
+        Dict[str, Optional[str]]: Section key -> extracted content, or None if not found
+    
+    Example:
+        >>> resume = "EDUCATION\\nBS Computer Science\\n\\nSKILLS\\nPython, Java"
+        >>> split_sections(resume, {'education': ['education'], 'skills': ['skills']})
+        {'education': 'BS Computer Science', 'skills': 'Python, Java'}
+    """
+    lines = preprocess_pdf_text(text).splitlines()
+    lowered = [ln.strip().lower() for ln in lines]
+    return {
+        key: _find_section_in_lines(lines, lowered, names)
+        for key, names in section_map.items()
+    }
+
+
+def _is_caps_header(line: str) -> bool:
+    """
+    Check for an all-caps header line, e.g. "WORK HISTORY".
+    
+    Same test as re.match(r'^[A-Z\\s]{3,}$', line) without running the regex
+    engine on every line.
+    """
+    if len(line) < 3:
+        return False
+    letters = ''.join(line.split())
+    return letters.isascii() and letters.isalpha() and letters.isupper()
+
+
+def _find_section_in_lines(lines: List[str], lowered: List[str],
+                           section_names: List[str]) -> Optional[str]:
+    """
+    Section lookup shared by find_section and split_sections.
+    
+    Args:
+        lines (List[str]): Preprocessed resume lines
+        lowered (List[str]): The same lines, stripped and lowercased
+        section_names (List[str]): Possible names for the section
+    
+    Returns:
+        Optional[str]: Extracted section content, or None if section not found
+    """
     idx = None
     
-    # Common section headers for detecting end of current section
-    all_headers = [
-        'experience', 'education', 'skills', 'technical skills', 'projects',
-        'certifications', 'leadership', 'extracurriculars', 'achievements',
-        'hackathon', 'summary', 'objective', 'work experience', 'professional experience'
-    ]
+    # Headers that mark the end of the current section
+    current = section_names[0].lower()
+    stop_headers = tuple(h for h in SECTION_HEADERS if h != current)
     
     # Find the line where the section starts
-    for i, ln in enumerate(lines):
-        l = ln.strip().lower()
-        for name in section_names:
-            if l.startswith(name) or name in l:
-                idx = i
-                break
-        if idx is not None:
+    for i, l in enumerate(lowered):
+        if any(name in l for name in section_names):
+            idx = i
             break
     
     # Section not found
@@ -211,35 +394,37 @@ def find_section(text: str, section_names: List[str]) -> Optional[str]:
     
     # Collect lines after the section header
     collected = []
-    for ln in lines[idx + 1:]:
-        l_lower = ln.strip().lower()
+    for ln, l_lower in zip(lines[idx + 1:], lowered[idx + 1:]):
+        stripped = ln.strip()
         
         # Stop at blank lines (if we already have content)
-        if not ln.strip():
+        if not stripped:
             if collected:
                 break
             else:
                 continue
         
         # Stop at next section header
-        is_next_section = False
-        for header in all_headers:
-            if header != section_names[0].lower() and (l_lower.startswith(header) or l_lower == header):
-                is_next_section = True
-                break
-        
-        if is_next_section:
+        if l_lower.startswith(stop_headers):
             break
         
         # Stop at all caps headers or colon-ended headers
-        if re.match(r'^[A-Z\s]{3,}$', ln.strip()) or ln.strip().endswith(':'):
+        if stripped.endswith(':') or _is_caps_header(stripped):
             break
         
-        collected.append(ln.strip())
+        collected.append(stripped)
     
     return '\n'.join(collected).strip() if collected else None
 
 
+# Email pattern: basic email format
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+
+# Phone pattern: flexible phone number format
+# Matches: +1-555-1234, (555) 123-4567, 555.123.4567, etc.
+_PHONE_RE = re.compile(r'(\+?\d[\d\s\-()]{6,}\d)')
+
+
 def extract_contact_info(text: str) -> dict:
     """
     Extract contact information (email and phone) from resume text.
@@ -258,16 +443,9 @@ def extract_contact_info(text: str) -> dict:
         >>> extract_contact_info("Contact: john@example.com, +1-555-1234")
         {'email': 'john@example.com', 'phone': '+1-555-1234'}
     """
-    # Email pattern: basic email format
-    email_re = re.compile(r'[\w\.-]+@[\w\.-]+')
-    
-    # Phone pattern: flexible phone number format
-    # Matches: +1-555-1234, (555) 123-4567, 555.123.4567, etc.
-    phone_re = re.compile(r'(\+?\d[\d\s\-()]{6,}\d)')
-    
     # Search for patterns
-    email = email_re.search(text)
-    phone = phone_re.search(text)
+    email = _EMAIL_RE.search(text)
+    phone = _PHONE_RE.search(text)
     
     return {
         'email': email.group(0) if email else None,
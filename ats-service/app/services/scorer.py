@@ -45,12 +45,169 @@ SCORING BREAKDOWN (v4 - Strict & Equal):
    - <65 = Needs improvement
 """
 
-from typing import Optional, Tuple, Dict, List, Any
+from typing import Optional, Tuple, Dict, List, Any, Set
+import hashlib
+import itertools
+import re
+import threading
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from app.utils.text_cleaner import clean_text, detect_formatting_risks
+from app.utils.text_cleaner import clean_text, clean_texts, detect_formatting_risks
+from app.services.extractor import extract_skills_from_resume
+from app.services.fast_tfidf import tfidf_batch_cosines, tfidf_pair_cosine
+from app.services.parser import extract_contact_info
+from app.services.tfidf_cache import get_vectorizer, relevance_cache, relevance_cache_key
+from app.utils.cache import LRUCache
+
+# pyahocorasick is an optional accelerator for the keyword checks in the
+# section scorers. Without it each keyword is checked with a substring test.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Recent SBERT embeddings, keyed by model + cleaned text. Resumes and job
+# descriptions are scored repeatedly (one resume vs many JDs, one JD vs
+# many resumes), so most texts only need encoding once.
+EMBEDDING_CACHE_SIZE = 8192
+_embedding_cache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+
+# Embeddings being encoded right now, so concurrent requests for the same
+# text wait for one encode instead of repeating it
+_inflight_encodes = {}
+_inflight_lock = threading.Lock()
+
+# Cache token per model instance. id() values are reused once an object is
+# garbage collected, so a reloaded model could otherwise hit the previous
+# model's embeddings; tokens from this counter are never reused.
+_model_tokens = itertools.count()
+_model_token_lock = threading.Lock()
+
+# Texts per SBERT forward pass. encode() sorts its input by length before
+# batching, so each batch pads to similar lengths; larger batches mostly
+# cost memory once the device is busy.
+SBERT_BATCH_SIZE = 32
+
+
+def _model_cache_token(sbert_model) -> int:
+    """
+    Return the embedding cache token of a model, assigning one on first use.
+    
+    The token is stored on the model itself, so it lives and dies with it.
+    """
+    token = getattr(sbert_model, '_ats_cache_token', None)
+    if token is None:
+        with _model_token_lock:
+            token = getattr(sbert_model, '_ats_cache_token', None)
+            if token is None:
+                token = next(_model_tokens)
+                sbert_model._ats_cache_token = token
+    return token
+
+
+def _encode_normalized(sbert_model, texts: List[str]) -> np.ndarray:
+    """
+    Encode texts to L2-normalized SBERT embeddings, using the embedding cache.
+    
+    All cache misses are encoded together in one encode() call, which runs
+    them in length-sorted batches of SBERT_BATCH_SIZE. A text another thread
+    is already encoding is waited for rather than encoded twice.
+    Each model instance gets its own cache token (see _model_cache_token),
+    so a reloaded or replaced model never gets another model's embeddings.
+    
+    Args:
+        sbert_model: SBERT model instance
+        texts (List[str]): Cleaned, non-empty texts
+    
+    Returns:
+        np.ndarray: One normalized embedding per text (len(texts) x dim)
+    """
+    model_token = _model_cache_token(sbert_model)
+    keys = [
+        (model_token, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        for text in texts
+    ]
+    embeddings = [_embedding_cache.get(key) for key in keys]
+    
+    missing = [i for i, emb in enumerate(embeddings) if emb is None]
+    
+    # Claim the keys nobody is encoding yet; wait for the others
+    owned, waiting = {}, {}
+    with _inflight_lock:
+        for i in missing:
+            key = keys[i]
+            if key in owned:
+                continue
+            event = _inflight_encodes.get(key)
+            if event is None:
+                owned[key] = _inflight_encodes[key] = threading.Event()
+            else:
+                waiting[key] = event
+    
+    try:
+        if owned:
+            owned_texts = {}
+            for i in missing:
+                if keys[i] in owned:
+                    owned_texts.setdefault(keys[i], texts[i])
+            encoded = sbert_model.encode(
+                list(owned_texts.values()),
+                batch_size=min(SBERT_BATCH_SIZE, len(owned_texts)),
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            for key, emb in zip(owned_texts, encoded):
+                # Copy so a cached row doesn't keep the whole batch array alive
+                _embedding_cache.set(key, emb.copy())
+    finally:
+        with _inflight_lock:
+            for key, event in owned.items():
+                del _inflight_encodes[key]
+                event.set()
+    
+    for event in waiting.values():
+        event.wait()
+    
+    for i in missing:
+        embeddings[i] = _embedding_cache.get(keys[i])
+    
+    # The other thread's encode failed, or the entry was already evicted
+    retry = [i for i in missing if embeddings[i] is None]
+    if retry:
+        encoded = sbert_model.encode(
+            [texts[i] for i in retry],
+            batch_size=min(SBERT_BATCH_SIZE, len(retry)),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        for i, emb in zip(retry, encoded):
+            embeddings[i] = emb.copy()
+    
+    return np.stack(embeddings)
+
+
+def _tfidf_cosine(a, b) -> float:
+    """
+    Cosine similarity of two rows of a TfidfVectorizer matrix.
+    
+    The vectorizer L2-normalizes every row, so the cosine is just the sparse
+    dot product - no need to renormalize like sklearn's cosine_similarity() does.
+    
+    Args:
+        a: 1 x n sparse TF-IDF row
+        b: 1 x n sparse TF-IDF row
+    
+    Returns:
+        float: Cosine similarity (0.0 if either row is empty)
+    """
+    return float(a.multiply(b).sum())
+
+
+def _is_blank(text: Optional[str]) -> bool:
+    """True for None, empty or whitespace-only text, which can never match."""
+    return not text or text.isspace()
 
 
 def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
@@ -65,6 +222,10 @@ def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
     
     This is the fallback method when SBERT is not available.
     
+    If a pre-fitted vectorizer is configured (ATS_TFIDF_VECTORIZER, see
+    tfidf_cache.py) it is used as-is; otherwise a vectorizer is fitted on the
+    two texts. Recent scores are cached.
+    
     Args:
         resume_text (str): Full resume text
         job_text (str): Job description text
@@ -77,20 +238,42 @@ def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
         ...                          "Looking for Python developer")
         0.65  # High similarity due to matching keywords
     """
+    # Nothing to compare: an empty TF-IDF row always scores 0
+    if _is_blank(resume_text) or _is_blank(job_text):
+        return 0.0
+    
+    # Same resume + job description: reuse the previous score
+    cache_key = relevance_cache_key(resume_text, job_text)
+    cached = relevance_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    sim = _compute_relevance_tfidf(resume_text, job_text)
+    relevance_cache.set(cache_key, sim)
+    return sim
+
+
+def _compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
+    """TF-IDF similarity without the result cache (see compute_relevance_tfidf)."""
     try:
-        # Create TF-IDF vectorizer with English stopword removal
-        vect = TfidfVectorizer(stop_words='english')
+        vect = get_vectorizer()
+        if vect is None:
+            # Same float as fitting TfidfVectorizer(stop_words='english') on
+            # both texts and calling cosine_similarity(), without sklearn
+            return tfidf_pair_cosine(job_text, resume_text)
         
-        # Fit and transform both texts
         # Order: [job_description, resume]
-        tfidf = vect.fit_transform([job_text or '', resume_text or ''])
+        docs = [job_text or '', resume_text or '']
+        
+        # Corpus-level vocabulary and IDF: only transform
+        tfidf = vect.transform(docs)
         
         # Ensure we have at least 2 documents
         if tfidf.shape[0] < 2:
             return 0.0
         
         # Calculate cosine similarity between job description and resume
-        sim = cosine_similarity(tfidf[0:1], tfidf[1:2])[0, 0]
+        sim = _tfidf_cosine(tfidf[0], tfidf[1])
         
         # Handle NaN values
         if np.isnan(sim):
@@ -102,6 +285,68 @@ def compute_relevance_tfidf(resume_text: str, job_text: str) -> float:
         return 0.0
 
 
+def compute_relevance_tfidf_batch(resume_texts: List[str], job_text: str) -> List[float]:
+    """
+    Calculate TF-IDF similarity for many resumes against one job description.
+    
+    Gives the same scores as calling compute_relevance_tfidf for each resume,
+    but tokenizes every text once and scores all resumes with a few sparse
+    matrix products instead of fitting one vectorizer per resume.
+    
+    Args:
+        resume_texts (List[str]): Full text of each resume
+        job_text (str): Job description text
+    
+    Returns:
+        List[float]: Similarity scores (0.0-1.0), in the same order as resume_texts
+    """
+    if _is_blank(job_text):
+        return [0.0] * len(resume_texts)
+    
+    scores = [None] * len(resume_texts)
+    
+    # Distinct resumes without a cached score -> their positions
+    pending = {}
+    for i, text in enumerate(resume_texts):
+        if _is_blank(text):
+            scores[i] = 0.0
+            continue
+        cached = relevance_cache.get(relevance_cache_key(text, job_text))
+        if cached is not None:
+            scores[i] = cached
+        else:
+            pending.setdefault(text or '', []).append(i)
+    
+    if pending:
+        texts = list(pending)
+        for text, sim in zip(texts, _compute_relevance_tfidf_batch(texts, job_text)):
+            relevance_cache.set(relevance_cache_key(text, job_text), sim)
+            for i in pending[text]:
+                scores[i] = sim
+    
+    return scores
+
+
+def _compute_relevance_tfidf_batch(resume_texts: List[str], job_text: str) -> List[float]:
+    """TF-IDF similarities without the result cache (see compute_relevance_tfidf_batch)."""
+    try:
+        vect = get_vectorizer()
+        if vect is not None:
+            # Corpus-level vocabulary and IDF: rows are L2-normalized, so
+            # one sparse product gives every cosine
+            resumes = vect.transform(resume_texts)
+            job = vect.transform([job_text or ''])
+            sims = (resumes @ job.T).toarray().ravel()
+        else:
+            sims = tfidf_batch_cosines(resume_texts, job_text)
+        
+        return [0.0 if np.isnan(sim) else float(sim) for sim in sims]
+    
+    except Exception:
+        # e.g. no terms left in any text after stopword removal
+        return [_compute_relevance_tfidf(text, job_text) for text in resume_texts]
+
+
 def ats_similarity_score_sbert(resume_text: str, jd_text: str, 
                                 sbert_model=None, sbert_enabled: bool = False,
                                 stop_words: set = None) -> float:
@@ -123,6 +368,10 @@ def ats_similarity_score_sbert(resume_text: str, jd_text: str,
     Returns:
         float: Similarity score between 0.0 and 1.0
     """
+    # Empty inputs score 0 with either method
+    if _is_blank(resume_text) or _is_blank(jd_text):
+        return 0.0
+    
     # If SBERT is not enabled, use TF-IDF fallback
     if not sbert_enabled or not sbert_model:
         return compute_relevance_tfidf(resume_text, jd_text)
@@ -137,11 +386,12 @@ def ats_similarity_score_sbert(resume_text: str, jd_text: str,
             return 0.0
         
         # Generate embeddings (numerical representations of text meaning)
-        resume_embedding = sbert_model.encode([resume_clean])
-        jd_embedding = sbert_model.encode([jd_clean])
+        # for both texts in one forward pass, skipping cached ones; they are
+        # normalized, so the dot product equals cosine similarity
+        resume_embedding, jd_embedding = _encode_normalized(sbert_model, [resume_clean, jd_clean])
         
         # Calculate cosine similarity
-        similarity = cosine_similarity(resume_embedding, jd_embedding)[0][0]
+        similarity = np.dot(resume_embedding, jd_embedding)
         
         # Ensure similarity is between 0 and 1
         similarity = max(0.0, min(1.0, float(similarity)))
@@ -154,8 +404,62 @@ def ats_similarity_score_sbert(resume_text: str, jd_text: str,
         return compute_relevance_tfidf(resume_text, jd_text)
 
 
+def ats_similarity_score_sbert_batch(resume_texts: List[str], jd_text: str,
+                                     sbert_model=None, sbert_enabled: bool = False,
+                                     stop_words: set = None) -> List[float]:
+    """
+    Calculate ATS similarity for many resumes against one job description.
+    
+    With SBERT, every distinct text (all resumes plus the job description)
+    is encoded in a single batched encode() call, and each score is a dot
+    product of normalized embeddings. This is much faster than calling
+    ats_similarity_score_sbert once per resume.
+    
+    Without SBERT, falls back to compute_relevance_tfidf_batch.
+    
+    Args:
+        resume_texts (List[str]): Full text of each resume
+        jd_text (str): Job description text
+        sbert_model: SBERT model instance (or None)
+        sbert_enabled (bool): Whether SBERT is available
+        stop_words (set): Set of stopwords for text cleaning
+    
+    Returns:
+        List[float]: Similarity scores (0.0-1.0), in the same order as resume_texts
+    """
+    if not sbert_enabled or not sbert_model:
+        return compute_relevance_tfidf_batch(resume_texts, jd_text)
+    
+    try:
+        resumes_clean = clean_texts(resume_texts, stop_words)
+        jd_clean = clean_text(jd_text, stop_words)
+        
+        if not jd_clean:
+            return [0.0] * len(resume_texts)
+        
+        # Encode each distinct non-empty text once (cached texts are skipped)
+        unique_texts = list(dict.fromkeys([jd_clean] + [t for t in resumes_clean if t]))
+        embeddings = _encode_normalized(sbert_model, unique_texts)
+        index = {text: i for i, text in enumerate(unique_texts)}
+        
+        # Cosine similarity == dot product for normalized embeddings
+        sims = embeddings @ embeddings[index[jd_clean]]
+        
+        return [
+            max(0.0, min(1.0, float(sims[index[text]]))) if text else 0.0
+            for text in resumes_clean
+        ]
+    
+    except Exception as e:
+        print(f"SBERT batch similarity calculation failed: {e}")
+        # Fallback to TF-IDF
+        return compute_relevance_tfidf_batch(resume_texts, jd_text)
+
+
 def compute_heuristics(text: str, parsed_sections: dict, 
-                       parsing_errors: List[str]) -> Tuple[float, List[str], Dict[str, float]]:
+                       parsing_errors: List[str],
+                       text_lower: Optional[str] = None,
+                       all_skills: Optional[List[str]] = None) -> Tuple[float, List[str], Dict[str, float]]:
     """
     Compute heuristic score based on resume QUALITY - not just presence.
     
@@ -178,6 +482,9 @@ def compute_heuristics(text: str, parsed_sections: dict,
         text (str): Full resume text
         parsed_sections (dict): Dictionary of extracted sections
         parsing_errors (List[str]): List of errors encountered during parsing
+        text_lower (str, optional): text.lower(), if the caller already has it
+        all_skills (List[str], optional): extract_skills_from_resume(text), if
+            the caller already has it
     
     Returns:
         Tuple containing:
@@ -185,28 +492,19 @@ def compute_heuristics(text: str, parsed_sections: dict,
         - feedback (List[str]): List of feedback messages
         - breakdown (Dict[str, float]): Score breakdown by component
     """
-    from app.services.extractor import extract_skills_from_resume
-    from app.services.parser import extract_contact_info
-    
     score = 0.0
     feedback = []
-    breakdown = {
-        'education': 0,
-        'experience': 0,
-        'skills': 0,
-        'projects': 0,
-        'contact': 0,
-        'parsingPenalty': 0
-    }
     
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    # Keyword hits in the full text, shared by all section scorers
+    full_hits = _find_keywords(text_lower)
     
     # ============================================
     # EDUCATION (0-10 points) - Quality based
     # ============================================
     education_text = parsed_sections.get('education', '') or ''
-    edu_score = _score_education(education_text, text_lower)
-    breakdown['education'] = round(edu_score, 1)
+    edu_score = _score_education(education_text.lower(), text_lower, full_hits)
     score += edu_score
     
     if edu_score < 5:
@@ -219,8 +517,7 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # EXPERIENCE (0-10 points) - Quality based
     # ============================================
     experience_text = parsed_sections.get('experience', '') or ''
-    exp_score = _score_experience(experience_text, text_lower)
-    breakdown['experience'] = round(exp_score, 1)
+    exp_score = _score_experience(experience_text.lower(), text_lower, full_hits)
     score += exp_score
     
     if exp_score < 5:
@@ -232,10 +529,10 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # SKILLS (0-10 points) - Quality based
     # ============================================
-    all_skills = extract_skills_from_resume(text)
+    if all_skills is None:
+        all_skills = extract_skills_from_resume(text, text_lower)
     skill_count = len(all_skills)
     skills_score = _score_skills(skill_count, all_skills)
-    breakdown['skills'] = round(skills_score, 1)
     score += skills_score
     
     if skills_score < 5:
@@ -245,8 +542,7 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # PROJECTS (0-10 points) - Quality based
     # ============================================
     projects_text = parsed_sections.get('projects', '') or ''
-    proj_score = _score_projects(projects_text, text_lower)
-    breakdown['projects'] = round(proj_score, 1)
+    proj_score = _score_projects(projects_text.lower(), text_lower, full_hits)
     score += proj_score
     
     if proj_score < 5:
@@ -259,8 +555,7 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # CONTACT (0-10 points) - Completeness based
     # ============================================
     contact = extract_contact_info(text)
-    contact_score = _score_contact(contact, text_lower)
-    breakdown['contact'] = round(contact_score, 1)
+    contact_score = _score_contact(contact, text_lower, full_hits)
     score += contact_score
     
     if contact_score < 5:
@@ -269,19 +564,174 @@ def compute_heuristics(text: str, parsed_sections: dict,
     # ============================================
     # PARSING PENALTY (-10 points max)
     # ============================================
+    penalty = 0
     if parsing_errors:
         penalty = min(10, len(parsing_errors) * 5)
-        breakdown['parsingPenalty'] = -penalty
         score -= penalty
         feedback.append('Parsing issues detected: ' + '; '.join(parsing_errors[:3]))
     
     # Clamp score to [0, 50]
     score = max(0.0, min(50.0, score))
     
+    # Built once here instead of updated per section
+    breakdown = {
+        'education': round(edu_score, 1),
+        'experience': round(exp_score, 1),
+        'skills': round(skills_score, 1),
+        'projects': round(proj_score, 1),
+        'contact': round(contact_score, 1),
+        'parsingPenalty': -penalty
+    }
+    
     return score, feedback, breakdown
 
 
-def _score_education(education_text: str, full_text: str) -> float:
+# Keyword groups used by the section scorers. Every check is a plain
+# substring test against the lowercased text.
+PHD_DEGREES = frozenset({'ph.d', 'phd', 'doctorate', 'doctoral'})
+MASTER_DEGREES = frozenset({'master', 'm.s.', 'm.sc', 'mba', 'm.tech', 'mtech'})
+BACHELOR_DEGREES = frozenset({'bachelor', 'b.s.', 'b.sc', 'b.tech', 'btech', 'b.e.', 'undergraduate'})
+OTHER_QUALIFICATIONS = frozenset({'diploma', 'associate', 'certificate'})
+RELEVANT_FIELDS = frozenset({
+    'computer science', 'software', 'engineering', 'information technology',
+    'data science', 'artificial intelligence', 'machine learning', 'mathematics',
+    'electrical', 'electronics', 'cs', 'cse', 'it', 'ece'
+})
+TOP_SCHOOLS = frozenset({
+    'mit', 'stanford', 'iit', 'nit', 'iiit', 'bits', 'harvard', 'berkeley',
+    'carnegie mellon', 'georgia tech', 'caltech', 'oxford', 'cambridge'
+})
+ACTION_VERBS = frozenset({
+    'led', 'developed', 'implemented', 'designed', 'architected', 'built',
+    'managed', 'created', 'optimized', 'improved', 'reduced', 'increased',
+    'delivered', 'launched', 'mentored', 'scaled', 'automated', 'integrated',
+    'deployed', 'spearheaded', 'established', 'transformed', 'pioneered'
+})
+SENIORITY_TERMS = frozenset({
+    'senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head', 'vp', 'cto', 'ceo'
+})
+TOP_COMPANIES = frozenset({
+    'google', 'amazon', 'microsoft', 'meta', 'facebook', 'apple', 'netflix',
+    'uber', 'airbnb', 'stripe', 'linkedin', 'twitter', 'salesforce', 'adobe'
+})
+PROJECT_INDICATORS = frozenset({'github.com', 'project:', 'built a', 'created a', 'developed a', 'hackathon'})
+PROJECT_TECH = frozenset({
+    'react', 'node', 'python', 'javascript', 'typescript', 'java', 'golang', 'rust',
+    'aws', 'docker', 'kubernetes', 'mongodb', 'postgresql', 'api', 'machine learning',
+    'tensorflow', 'pytorch', 'database', 'microservices'
+})
+PROJECT_LINKS = frozenset({
+    'github.com', 'gitlab.com', 'bitbucket', 'herokuapp', 'vercel', 'netlify', 'http://', 'https://'
+})
+CONTACT_PROFILES = frozenset({'linkedin', 'github'})
+PORTFOLIO_INDICATORS = frozenset({'portfolio', 'website', '.com/', '.io/', 'vercel.app', 'netlify.app'})
+DEPTH_ACTION_VERBS = frozenset({
+    'led', 'developed', 'implemented', 'designed', 'architected',
+    'managed', 'built', 'created', 'optimized', 'improved',
+    'reduced', 'increased', 'delivered', 'launched', 'mentored',
+    'scaled', 'automated', 'integrated', 'deployed', 'spearheaded'
+})
+DEPTH_SENIORITY_TERMS = frozenset({
+    'senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of'
+})
+DEPTH_TECH_TERMS = frozenset({
+    'api', 'database', 'cloud', 'aws', 'gcp', 'azure', 'kubernetes', 'docker',
+    'microservices', 'ci/cd', 'agile', 'scrum', 'testing', 'security'
+})
+
+_ALL_KEYWORDS = frozenset().union(
+    PHD_DEGREES, MASTER_DEGREES, BACHELOR_DEGREES, OTHER_QUALIFICATIONS,
+    RELEVANT_FIELDS, TOP_SCHOOLS, ACTION_VERBS, SENIORITY_TERMS, TOP_COMPANIES,
+    PROJECT_INDICATORS, PROJECT_TECH, PROJECT_LINKS, CONTACT_PROFILES,
+    PORTFOLIO_INDICATORS, DEPTH_ACTION_VERBS, DEPTH_SENIORITY_TERMS, DEPTH_TECH_TERMS
+)
+_MAX_KEYWORD_LEN = max(len(keyword) for keyword in _ALL_KEYWORDS)
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over every scorer keyword.
+    
+    Returns:
+        ahocorasick.Automaton or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _find_keywords(text: str) -> Set[str]:
+    """
+    Find which scorer keywords occur anywhere in a lowercased text.
+    
+    One pass over the text answers every "keyword in text" question the
+    section scorers ask, instead of one scan per keyword.
+    
+    Args:
+        text (str): Lowercased text
+    
+    Returns:
+        Set[str]: Keywords that occur in the text (as substrings)
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text)}
+    return {keyword for keyword in _ALL_KEYWORDS if keyword in text}
+
+
+def _find_section_keywords(section_lower: str, text_lower: str,
+                           full_hits: Optional[Set[str]] = None) -> Set[str]:
+    """
+    Find the keywords in section_lower + ' ' + text_lower without building
+    the joined string.
+    
+    Only a short window around the join can hold a keyword that neither
+    part contains on its own.
+    
+    Args:
+        section_lower (str): Lowercased section text
+        text_lower (str): Lowercased full resume text
+        full_hits (Set[str], optional): _find_keywords(text_lower), if known
+    
+    Returns:
+        Set[str]: Keywords that occur in the joined text
+    """
+    if full_hits is None:
+        full_hits = _find_keywords(text_lower)
+    if not section_lower:
+        return full_hits
+    
+    edge = _MAX_KEYWORD_LEN - 1
+    join_window = section_lower[-edge:] + ' ' + text_lower[:edge]
+    return full_hits | _find_keywords(section_lower) | _find_keywords(join_window)
+
+
+# Patterns used by the section scorers, compiled once
+# Durations like "2 years", "6 months", "1.5 yrs"
+_YEAR_DURATION_RE = re.compile(r'(\d+\.?\d*)\s*(?:years?|yrs?)')
+_MONTH_DURATION_RE = re.compile(r'(\d+\.?\d*)\s*(?:months?|mos?)')
+# Years 2010-2029
+_YEAR_RE = re.compile(r'20[12]\d')
+# Quantified achievements: 40%, $1m, 10 users, ...
+_EXPERIENCE_METRIC_RE = re.compile(
+    r'\d+%|\$\d+[kmb]?|\d+\s*(?:users|customers|clients|projects|applications|team|engineers|developers)'
+)
+_DEPTH_METRIC_RE = re.compile(
+    r'\d+%|\$\d+|\d+\s*(?:users|customers|engineers|developers|team|projects|applications)'
+)
+# Project impact: usage numbers or deployment mentions
+_PROJECT_IMPACT_RE = re.compile(r'\d+\s*(?:users|downloads|stars|forks|views)|deployed|production|live')
+
+
+def _score_education(education_text: str, full_text: str,
+                     full_hits: Optional[Set[str]] = None) -> float:
     """
     Score education section based on quality (0-10).
     
@@ -292,40 +742,39 @@ def _score_education(education_text: str, full_text: str) -> float:
     - 7: Degree + relevant field (CS, Engineering, etc.)
     - 9: Degree + field + recognized institution
     - 10: Graduate degree or top institution
+    
+    Both texts are expected to be lowercased already; full_hits is
+    _find_keywords(full_text) when the caller has it.
     """
     if not education_text and 'education' not in full_text:
         return 0.0
     
-    text = (education_text + ' ' + full_text).lower()
+    hits = _find_section_keywords(education_text, full_text, full_hits)
     score = 2.0  # Base for having section
     
     # Degree types (higher = better)
-    if any(deg in text for deg in ['ph.d', 'phd', 'doctorate', 'doctoral']):
+    if not hits.isdisjoint(PHD_DEGREES):
         score += 5.0
-    elif any(deg in text for deg in ['master', 'm.s.', 'm.sc', 'mba', 'm.tech', 'mtech']):
+    elif not hits.isdisjoint(MASTER_DEGREES):
         score += 4.0
-    elif any(deg in text for deg in ['bachelor', 'b.s.', 'b.sc', 'b.tech', 'btech', 'b.e.', 'undergraduate']):
+    elif not hits.isdisjoint(BACHELOR_DEGREES):
         score += 3.0
-    elif any(deg in text for deg in ['diploma', 'associate', 'certificate']):
+    elif not hits.isdisjoint(OTHER_QUALIFICATIONS):
         score += 1.5
     
     # Relevant field
-    relevant_fields = ['computer science', 'software', 'engineering', 'information technology',
-                       'data science', 'artificial intelligence', 'machine learning', 'mathematics',
-                       'electrical', 'electronics', 'cs', 'cse', 'it', 'ece']
-    if any(field in text for field in relevant_fields):
+    if not hits.isdisjoint(RELEVANT_FIELDS):
         score += 1.5
     
     # Top institutions (partial list - add more as needed)
-    top_schools = ['mit', 'stanford', 'iit', 'nit', 'iiit', 'bits', 'harvard', 'berkeley',
-                   'carnegie mellon', 'georgia tech', 'caltech', 'oxford', 'cambridge']
-    if any(school in text for school in top_schools):
+    if not hits.isdisjoint(TOP_SCHOOLS):
         score += 1.0
     
     return min(10.0, score)
 
 
-def _score_experience(experience_text: str, full_text: str) -> float:
+def _score_experience(experience_text: str, full_text: str,
+                      full_hits: Optional[Set[str]] = None) -> float:
     """
     Score experience section based on quality (0-10).
     
@@ -335,31 +784,24 @@ def _score_experience(experience_text: str, full_text: str) -> float:
     - Quantified achievements: %, $, numbers = up to 2 points
     - Seniority indicators: Senior, Lead, Manager = up to 1 point
     - Company recognition = up to 0.5 points
+    
+    Both texts are expected to be lowercased already; full_hits is
+    _find_keywords(full_text) when the caller has it.
     """
     if not experience_text and 'experience' not in full_text:
         return 0.0
     
-    text = (experience_text + ' ' + full_text).lower()
+    text = experience_text + ' ' + full_text
+    hits = _find_section_keywords(experience_text, full_text, full_hits)
     score = 0.0
     
-    import re
-    
     # Experience Duration (up to 4 points) - KEY FACTOR
     # Look for patterns like "2 years", "6 months", "1.5 years", etc.
-    duration_patterns = [
-        r'(\d+\.?\d*)\s*(?:years?|yrs?)',
-        r'(\d+\.?\d*)\s*(?:months?|mos?)',
-    ]
-    
     total_months = 0
-    for pattern in duration_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            val = float(match)
-            if 'year' in pattern or 'yr' in pattern:
-                total_months += val * 12
-            else:
-                total_months += val
+    for match in _YEAR_DURATION_RE.findall(text):
+        total_months += float(match) * 12
+    for match in _MONTH_DURATION_RE.findall(text):
+        total_months += float(match)
     
     # Duration scoring
     # Duration scoring (Max 4.0 points)
@@ -377,7 +819,7 @@ def _score_experience(experience_text: str, full_text: str) -> float:
     # Fallback: Date range detection if no explicit "X years" found
     if not found_duration:
         # Check for years (2010-2029)
-        years = re.findall(r'20[12]\d', text)
+        years = _YEAR_RE.findall(text)
         distinct_years = len(set(years))
         
         if distinct_years >= 2:
@@ -390,28 +832,19 @@ def _score_experience(experience_text: str, full_text: str) -> float:
             score += 1.0  # Decent length description as fallback
     
     # Action verbs (up to 2.5 points)
-    action_verbs = [
-        'led', 'developed', 'implemented', 'designed', 'architected', 'built',
-        'managed', 'created', 'optimized', 'improved', 'reduced', 'increased',
-        'delivered', 'launched', 'mentored', 'scaled', 'automated', 'integrated',
-        'deployed', 'spearheaded', 'established', 'transformed', 'pioneered'
-    ]
-    action_count = sum(1 for v in action_verbs if v in text)
+    action_count = len(hits & ACTION_VERBS)
     score += min(2.5, action_count * 0.35)
     
     # Quantified achievements (up to 2 points)
-    metrics = re.findall(r'\d+%|\$\d+[kmb]?|\d+\s*(?:users|customers|clients|projects|applications|team|engineers|developers)', text)
+    metrics = _EXPERIENCE_METRIC_RE.findall(text)
     score += min(2.0, len(metrics) * 0.4)
     
     # Seniority (up to 1 point)
-    seniority = ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head', 'vp', 'cto', 'ceo']
-    seniority_count = sum(1 for s in seniority if s in text)
+    seniority_count = len(hits & SENIORITY_TERMS)
     score += min(1.0, seniority_count * 0.5)
     
     # Recognized companies (up to 0.5 points)
-    top_companies = ['google', 'amazon', 'microsoft', 'meta', 'facebook', 'apple', 'netflix',
-                     'uber', 'airbnb', 'stripe', 'linkedin', 'twitter', 'salesforce', 'adobe']
-    if any(company in text for company in top_companies):
+    if not hits.isdisjoint(TOP_COMPANIES):
         score += 0.5
     
     return min(10.0, round(score, 1))
@@ -441,7 +874,29 @@ def _score_skills(skill_count: int, skills_list: List) -> float:
         return 10.0
 
 
-def _score_projects(projects_text: str, full_text: str) -> float:
+# _score_skills for every count up to 25; 25+ all score 10.0
+_SKILL_SCORE_TABLE = np.array([_score_skills(count, []) for count in range(26)])
+
+
+def score_skills_batch(skill_counts) -> np.ndarray:
+    """
+    Vectorized _score_skills for many resumes at once.
+    
+    Looks each count up in a precomputed table instead of walking the
+    if/elif ladder in Python, with exactly the same scores.
+    
+    Args:
+        skill_counts (array-like): Number of skills found per resume
+    
+    Returns:
+        np.ndarray: Skills score (0-10) per resume
+    """
+    counts = np.asarray(skill_counts, dtype=np.int64)
+    return _SKILL_SCORE_TABLE[np.clip(counts, 0, len(_SKILL_SCORE_TABLE) - 1)]
+
+
+def _score_projects(projects_text: str, full_text: str,
+                    full_hits: Optional[Set[str]] = None) -> float:
     """
     Score projects section based on quality (0-10).
     
@@ -450,35 +905,35 @@ def _score_projects(projects_text: str, full_text: str) -> float:
     - Technical stack mentions
     - Impact/results described
     - Links to GitHub/live demos
+    
+    Both texts are expected to be lowercased already; full_hits is
+    _find_keywords(full_text) when the caller has it.
     """
+    if full_hits is None:
+        full_hits = _find_keywords(full_text)
+    
     # Check for projects section or project-like content
     if not projects_text:
         # Try to find projects mentioned elsewhere
-        project_indicators = ['github.com', 'project:', 'built a', 'created a', 'developed a', 'hackathon']
-        if not any(ind in full_text for ind in project_indicators):
+        if full_hits.isdisjoint(PROJECT_INDICATORS):
             return 0.0
-        text = full_text
+        text_lower = full_text
     else:
-        text = projects_text + ' ' + full_text
+        text_lower = projects_text + ' ' + full_text
     
-    text_lower = text.lower()
+    hits = _find_section_keywords(projects_text, full_text, full_hits)
     score = 2.0  # Base for having projects
     
     # Technical stack mentioned (up to 3 points)
-    tech_indicators = ['react', 'node', 'python', 'javascript', 'typescript', 'java', 'golang', 'rust',
-                       'aws', 'docker', 'kubernetes', 'mongodb', 'postgresql', 'api', 'machine learning',
-                       'tensorflow', 'pytorch', 'database', 'microservices']
-    tech_count = sum(1 for t in tech_indicators if t in text_lower)
+    tech_count = len(hits & PROJECT_TECH)
     score += min(3.0, tech_count * 0.5)
     
     # Project impact/metrics (up to 2 points)
-    import re
-    impact_patterns = re.findall(r'\d+\s*(?:users|downloads|stars|forks|views)|deployed|production|live', text_lower)
+    impact_patterns = _PROJECT_IMPACT_RE.findall(text_lower)
     score += min(2.0, len(impact_patterns) * 0.5)
     
     # Links to work (up to 2 points)
-    links = ['github.com', 'gitlab.com', 'bitbucket', 'herokuapp', 'vercel', 'netlify', 'http://', 'https://']
-    link_count = sum(1 for l in links if l in text_lower)
+    link_count = len(hits & PROJECT_LINKS)
     score += min(2.0, link_count * 0.7)
     
     # Multiple projects mentioned (up to 1 point)
@@ -491,7 +946,8 @@ def _score_projects(projects_text: str, full_text: str) -> float:
     return min(10.0, score)
 
 
-def _score_contact(contact: dict, full_text: str) -> float:
+def _score_contact(contact: dict, full_text: str,
+                   full_hits: Optional[Set[str]] = None) -> float:
     """
     Score contact information based on completeness (0-10).
     
@@ -503,6 +959,7 @@ def _score_contact(contact: dict, full_text: str) -> float:
     - Portfolio/Website: 1 point
     """
     score = 0.0
+    hits = full_hits if full_hits is not None else _find_keywords(full_text)
     
     # Email (3 points)
     if contact.get('email'):
@@ -513,16 +970,15 @@ def _score_contact(contact: dict, full_text: str) -> float:
         score += 2.0
     
     # LinkedIn (2 points)
-    if 'linkedin.com' in full_text or 'linkedin' in full_text:
+    if 'linkedin' in hits:
         score += 2.0
     
     # GitHub (2 points)
-    if 'github.com' in full_text or 'github' in full_text:
+    if 'github' in hits:
         score += 2.0
     
     # Portfolio/Website (1 point)
-    portfolio_indicators = ['portfolio', 'website', '.com/', '.io/', 'vercel.app', 'netlify.app']
-    if any(ind in full_text for ind in portfolio_indicators):
+    if not hits.isdisjoint(PORTFOLIO_INDICATORS):
         score += 1.0
     
     return min(10.0, score)
@@ -543,33 +999,24 @@ def _compute_experience_depth(experience_section: str, full_text: str) -> float:
     """
     text_to_analyze = experience_section if experience_section else full_text
     text_lower = text_to_analyze.lower()
+    hits = _find_keywords(text_lower)
     
     score = 0.0
     
     # Action verbs indicate impactful experience (up to 3 points)
-    action_verbs = [
-        'led', 'developed', 'implemented', 'designed', 'architected',
-        'managed', 'built', 'created', 'optimized', 'improved',
-        'reduced', 'increased', 'delivered', 'launched', 'mentored',
-        'scaled', 'automated', 'integrated', 'deployed', 'spearheaded'
-    ]
-    action_count = sum(1 for verb in action_verbs if verb in text_lower)
+    action_count = len(hits & DEPTH_ACTION_VERBS)
     score += min(3.0, action_count * 0.5)
     
     # Quantified achievements indicate measurable impact (up to 3 points)
-    import re
-    numbers = re.findall(r'\d+%|\$\d+|\d+\s*(?:users|customers|engineers|developers|team|projects|applications)', text_lower)
+    numbers = _DEPTH_METRIC_RE.findall(text_lower)
     score += min(3.0, len(numbers) * 0.75)
     
     # Seniority indicators (up to 2 points)
-    seniority_terms = ['senior', 'lead', 'principal', 'staff', 'architect', 'manager', 'director', 'head of']
-    seniority_count = sum(1 for term in seniority_terms if term in text_lower)
+    seniority_count = len(hits & DEPTH_SENIORITY_TERMS)
     score += min(2.0, seniority_count * 1.0)
     
     # Technical breadth - multiple technology mentions (up to 2 points)
-    tech_terms = ['api', 'database', 'cloud', 'aws', 'gcp', 'azure', 'kubernetes', 'docker', 
-                  'microservices', 'ci/cd', 'agile', 'scrum', 'testing', 'security']
-    tech_count = sum(1 for term in tech_terms if term in text_lower)
+    tech_count = len(hits & DEPTH_TECH_TERMS)
     score += min(2.0, tech_count * 0.4)
     
     return min(10.0, score)
@@ -654,6 +1101,49 @@ def normalize_score(heuristics_score: float,
     return round(total, 2), breakdown
 
 
+def normalize_score_batch(heuristics_scores, relevances) -> np.ndarray:
+    """
+    Vectorized normalize_score total for many resumes at once.
+    
+    Applies the same scaling and relevance curve as normalize_score with
+    NumPy array operations instead of a Python loop, e.g. to rank a whole
+    leaderboard. Only the final scores are returned, not the breakdowns.
+    
+    Args:
+        heuristics_scores (array-like): Scores from compute_heuristics (0-50)
+        relevances (array-like): Similarity scores (0-1); None, NaN or 0.0
+            mean no job description, as in normalize_score
+    
+    Returns:
+        np.ndarray: Final scores (0-100), rounded to 2 decimals
+    """
+    heuristics = np.asarray(heuristics_scores, dtype=np.float64)
+    relevance = np.asarray(
+        [np.nan if r is None else r for r in relevances], dtype=np.float64
+    )
+    
+    # Same piecewise curve as normalize_score
+    relevance_component = np.where(
+        relevance < 0.3,
+        relevance * 35.0,
+        np.where(relevance < 0.6,
+                 10.5 + (relevance - 0.3) * 45.0,
+                 24 + (relevance - 0.6) * 65.0)
+    )
+    
+    no_jd = np.isnan(relevance) | (relevance == 0.0)
+    total = np.where(
+        no_jd,
+        heuristics * 2.0 * 0.98,
+        (heuristics + relevance_component) * 0.98
+    )
+    
+    # Python's round() (correctly rounded) so every score matches
+    # normalize_score exactly; np.round can differ in the last digit
+    total = np.clip(total, 0.0, 100.0)
+    return np.array([round(t, 2) for t in total.tolist()])
+
+
 def generate_white_box_feedback(feedback_items: List[str], relevance: float,
                                 parsed_sections: dict, contact: dict,
                                 breakdown_components: dict,
@@ -0,0 +1,105 @@
+"""
+TF-IDF Vectorizer Cache
+
+This module manages an optional, pre-fitted TF-IDF vectorizer and a cache
+of recent TF-IDF relevance scores.
+
+By default the scorer fits a fresh TfidfVectorizer on just the resume and
+the job description for every request. A vectorizer fitted once on a larger
+corpus of resumes and job descriptions gives more meaningful IDF weights and
+skips the per-request vocabulary building; point ATS_TFIDF_VECTORIZER at a
+pickle created with fit_vectorizer() to use one.
+
+Key Responsibilities:
+- Fit and pickle a corpus-level vectorizer
+- Load the configured vectorizer once per process
+- Cache relevance scores for repeated resume/job description pairs
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import Iterable, Optional
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from app.utils.cache import LRUCache
+
+# Path to a pickled, pre-fitted TfidfVectorizer (unset = fit per request)
+VECTORIZER_PATH = os.environ.get('ATS_TFIDF_VECTORIZER')
+
+# Recent TF-IDF relevance scores, keyed by resume + job description
+RELEVANCE_CACHE_SIZE = 1024
+relevance_cache = LRUCache(maxsize=RELEVANCE_CACHE_SIZE)
+
+_vectorizer = None
+_vectorizer_loaded = False
+_vectorizer_lock = threading.Lock()
+
+
+def fit_vectorizer(corpus: Iterable[str], path: str) -> TfidfVectorizer:
+    """
+    Fit a TF-IDF vectorizer on a corpus and pickle it to disk.
+    
+    Uses the same settings as the per-request vectorizer so scores stay
+    comparable; only the IDF statistics change.
+    
+    Args:
+        corpus (Iterable[str]): Resumes and/or job descriptions
+        path (str): Where to write the pickle
+    
+    Returns:
+        TfidfVectorizer: The fitted vectorizer
+    
+    Example:
+        >>> fit_vectorizer(resume_texts + job_descriptions, 'tfidf.pkl')
+        >>> # then start the service with ATS_TFIDF_VECTORIZER=tfidf.pkl
+    """
+    vect = TfidfVectorizer(stop_words='english')
+    vect.fit(corpus)
+    with open(path, 'wb') as f:
+        pickle.dump(vect, f)
+    return vect
+
+
+def get_vectorizer() -> Optional[TfidfVectorizer]:
+    """
+    Return the pre-fitted vectorizer, loading it on first use.
+    
+    Only load pickles you created yourself: unpickling runs arbitrary code.
+    
+    Returns:
+        Optional[TfidfVectorizer]: The configured vectorizer, or None if
+        ATS_TFIDF_VECTORIZER is unset or cannot be loaded
+    """
+    global _vectorizer, _vectorizer_loaded
+    
+    if _vectorizer_loaded:
+        return _vectorizer
+    
+    with _vectorizer_lock:
+        if not _vectorizer_loaded:
+            if VECTORIZER_PATH:
+                try:
+                    with open(VECTORIZER_PATH, 'rb') as f:
+                        _vectorizer = pickle.load(f)
+                except Exception as e:
+                    print(f"Warning: Could not load TF-IDF vectorizer from {VECTORIZER_PATH}: {e}")
+                    print("Falling back to per-request TF-IDF fitting")
+                    _vectorizer = None
+            _vectorizer_loaded = True
+    
+    return _vectorizer
+
+
+def relevance_cache_key(resume_text: str, job_text: str) -> tuple:
+    """
+    Build the relevance cache key for a resume/job description pair.
+    
+    Texts are hashed so the cache never holds full resumes.
+    """
+    return (
+        hashlib.blake2b((resume_text or '').encode('utf-8'), digest_size=16).digest(),
+        hashlib.blake2b((job_text or '').encode('utf-8'), digest_size=16).digest()
+    )
@@ -6,14 +6,19 @@ Helper functions and utilities used across the ATS service.
 
 from app.utils.text_cleaner import (
     clean_text,
+    clean_texts,
     detect_formatting_risks,
     normalize_whitespace,
     remove_special_characters
 )
 
+from app.utils.cache import LRUCache
+
 __all__ = [
     'clean_text',
+    'clean_texts',
     'detect_formatting_risks',
     'normalize_whitespace',
-    'remove_special_characters'
+    'remove_special_characters',
+    'LRUCache'
 ]
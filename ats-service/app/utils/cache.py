@@ -0,0 +1,78 @@
+"""
+Caching Utilities
+
+This module contains a small in-memory cache used to avoid repeating
+expensive work (file parsing, similarity scoring) for identical inputs.
+
+Key Responsibilities:
+- Store a bounded number of recent results
+- Evict the least recently used entry when full
+- Stay safe when handlers run in a thread pool
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache.
+    
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.get('missing') is None
+        True
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Look up a value and mark it as recently used.
+        
+        Args:
+            key (Hashable): Cache key
+            default (Any, optional): Value returned when the key is missing
+        
+        Returns:
+            Any: Cached value, or default if not found
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -11,8 +11,48 @@ Key Responsibilities:
 - Detect formatting issues
 """
 
+import functools
 import re
-from typing import List
+from typing import Iterable, List, Tuple
+
+# numba is an optional accelerator for the line scan in
+# detect_formatting_risks. Without it lines are scanned in Python.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+class _CleanTable(dict):
+    """
+    str.translate() table for clean_text, filled in as characters are seen.
+    
+    Maps each character to its lowercase form, with everything but a-z and
+    whitespace turned into a space: text.lower() followed by
+    re.sub(r'[^a-z\s]', ' ', text), in one pass.
+    """
+    
+    def __missing__(self, codepoint: int) -> str:
+        value = ''.join(
+            ch if ('a' <= ch <= 'z' or ch.isspace()) else ' '
+            for ch in chr(codepoint).lower()
+        )
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable()
+
+# The same mapping as a bytes.translate() table, for pure-ASCII text
+_ASCII_CLEAN_TABLE = bytes(ord(_CLEAN_TABLE[c]) if c < 128 else 0x20 for c in range(256))
+
+
+# Cleaned texts are memoized: the same resume or job description is cleaned
+# again for every pairing it is scored in. Very large texts are not cached
+# so the cache stays small.
+CLEAN_CACHE_SIZE = 256
+CLEAN_CACHE_MAX_CHARS = 100_000
 
 
 def clean_text(text: str, stop_words: set = None) -> str:
@@ -25,9 +65,13 @@ def clean_text(text: str, stop_words: set = None) -> str:
     3. Normalizes whitespace (removes extra spaces)
     4. Optionally removes stopwords (common words like 'the', 'is', etc.)
     
+    Results are cached per (text, stop words); pass a frozenset to avoid
+    copying the stop words on every call.
+    
     Args:
         text (str): Raw text to clean
         stop_words (set, optional): Set of stopwords to remove. If None, no stopword removal.
+            Other iterables (e.g. a list or set) are converted to a frozenset first.
     
     Returns:
         str: Cleaned and normalized text
@@ -39,20 +83,113 @@ def clean_text(text: str, stop_words: set = None) -> str:
     if not text:
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
+    if not stop_words:
+        stop_words = None
+    elif not isinstance(stop_words, frozenset):
+        # Hashable for the cache key, and O(1) membership tests
+        stop_words = frozenset(stop_words)
+    
+    if len(text) > CLEAN_CACHE_MAX_CHARS:
+        return _clean_text(text, stop_words)
+    return _clean_text_cached(text, stop_words)
+
+
+def clean_texts(texts: Iterable[str], stop_words: set = None) -> List[str]:
+    """
+    Clean many texts with the same stop words.
     
-    # Remove special characters, keep only letters and spaces
-    text = re.sub(r'[^a-z\s]', ' ', text)
+    Same result as calling clean_text on each text, but stop_words is
+    converted to a frozenset once for the whole batch rather than per text.
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    Args:
+        texts (Iterable[str]): Raw texts to clean
+        stop_words (set, optional): Stopwords to remove, as for clean_text
     
-    # Remove stopwords if provided
-    if stop_words:
-        text = " ".join(word for word in text.split() if word not in stop_words)
+    Returns:
+        List[str]: Cleaned texts, in the same order as texts
     
-    return text
+    Example:
+        >>> clean_texts(["Hello, World!", "A TEST."])
+        ['hello world', 'a test']
+    """
+    if stop_words and not isinstance(stop_words, frozenset):
+        stop_words = frozenset(stop_words)
+    return [clean_text(text, stop_words) for text in texts]
+
+
+def _clean_text(text: str, stop_words: frozenset = None) -> str:
+    """clean_text without the cache; stop_words must be a frozenset or None."""
+    # Convert to lowercase and replace special characters with spaces,
+    # keeping only letters and whitespace. Extracted resume text is almost
+    # always ASCII, which a byte-level table handles fastest.
+    if text.isascii():
+        text = text.encode('ascii').translate(_ASCII_CLEAN_TABLE).decode('ascii')
+    else:
+        text = text.translate(_CLEAN_TABLE)
+    
+    # Split on runs of whitespace (str.split() and re's \s agree on what
+    # whitespace is); joining with single spaces removes the extra whitespace
+    words = text.split()
+    
+    # Remove stopwords if provided. isdisjoint() stops at the first stopword,
+    # so checking first only costs a full scan when there is nothing to
+    # remove (e.g. stopwords for another language).
+    if stop_words and not stop_words.isdisjoint(words):
+        words = [word for word in words if word not in stop_words]
+    
+    return " ".join(words)
+
+
+_clean_text_cached = functools.lru_cache(maxsize=CLEAN_CACHE_SIZE)(_clean_text)
+
+
+def _count_caps_lines(buf) -> Tuple[int, int]:
+    """
+    Count non-blank lines and long ALL-CAPS lines in ASCII bytes.
+    
+    Matches the str.splitlines() / isspace() / isupper() / strip() checks in
+    detect_formatting_risks for ASCII text. Line breaks are the bytes
+    splitlines() splits on; a "\\r\\n" pair just adds an empty line, which
+    is not counted.
+    
+    Args:
+        buf (np.ndarray): uint8 view of ASCII text
+    
+    Returns:
+        Tuple[int, int]: (non-blank lines, ALL-CAPS lines longer than 10 chars)
+    """
+    line_count = 0
+    caps_count = 0
+    has_upper = False
+    has_lower = False
+    first = -1
+    last = -1
+    n = buf.shape[0]
+    for i in range(n + 1):
+        c = buf[i] if i < n else 10
+        # \n \v \f \r and the \x1c-\x1e separators end a line
+        if (10 <= c <= 13) or (28 <= c <= 30):
+            if first >= 0:
+                line_count += 1
+                if has_upper and not has_lower and last - first + 1 > 10:
+                    caps_count += 1
+            has_upper = False
+            has_lower = False
+            first = -1
+        elif c != 32 and c != 9 and c != 31:
+            # Not in-line whitespace (space, \t, \x1f)
+            if first < 0:
+                first = i
+            last = i
+            if 65 <= c <= 90:
+                has_upper = True
+            elif 97 <= c <= 122:
+                has_lower = True
+    return line_count, caps_count
+
+
+if njit is not None:
+    _count_caps_lines = njit(cache=True, nogil=True)(_count_caps_lines)
 
 
 def detect_formatting_risks(text: str) -> List[str]:
@@ -79,11 +216,34 @@ def detect_formatting_risks(text: str) -> List[str]:
     """
     risks = []
     
-    # Split into non-empty lines
-    lines = [ln for ln in text.splitlines() if ln.strip()]
+    # Count non-empty lines and long ALL-CAPS lines in one pass, without
+    # building a filtered list. Whitespace is never cased, so
+    # ln.isupper() == ln.strip().isupper() and only caps lines get stripped.
+    # Stops early once more than 20% of all lines are already long ALL-CAPS
+    # lines, since the remaining lines can no longer bring the ratio down.
+    if njit is not None and text.isascii():
+        # Compiled scan over the raw bytes, no str object per line
+        line_count, caps_count = _count_caps_lines(
+            np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        )
+    else:
+        line_count = 0
+        caps_count = 0
+        lines = text.splitlines()
+        remaining = len(lines)
+        for ln in lines:
+            remaining -= 1
+            if not ln or ln.isspace():
+                continue
+            line_count += 1
+            if ln.isupper() and len(ln.strip()) > 10:
+                caps_count += 1
+                # Over 20% even if every remaining line is non-empty, not caps
+                if caps_count * 5 > line_count + remaining:
+                    break
     
     # Check if document is empty
-    if not lines:
+    if not line_count:
         risks.append('Empty or unreadable document')
         return risks
     
@@ -93,7 +253,7 @@ def detect_formatting_risks(text: str) -> List[str]:
     # Modern resumes with columns, tables, etc. often extract as long lines.
     
     # Check for excessive ALL-CAPS text
-    all_caps_ratio = sum(1 for ln in lines if ln.strip().isupper() and len(ln.strip()) > 10) / max(1, len(lines))
+    all_caps_ratio = caps_count / max(1, line_count)
     if all_caps_ratio > 0.2:  # More than 20% of lines are all caps (and long)
         risks.append('Excessive ALL-CAPS lines')
     
@@ -113,10 +273,8 @@ def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
     
-    # Replace multiple whitespace characters with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    # Replace runs of whitespace with a single space, trimming both ends
+    return ' '.join(text.split())
 
 
 def remove_special_characters(text: str, keep_chars: str = "") -> str:
@@ -133,7 +291,30 @@ def remove_special_characters(text: str, keep_chars: str = "") -> str:
     if not text:
         return ""
     
+    # Pure-ASCII text maps each byte through a 256-entry table instead
+    if text.isascii():
+        return text.encode('ascii').translate(_special_chars_table(keep_chars)).decode('ascii')
+    
+    return _special_chars_re(keep_chars).sub(' ', text)
+
+
+@functools.lru_cache(maxsize=32)
+def _special_chars_re(keep_chars: str):
+    """Compiled pattern for remove_special_characters, one per keep_chars."""
     # Build pattern: keep letters, numbers, spaces, and specified characters
-    pattern = f'[^a-zA-Z0-9\\s{re.escape(keep_chars)}]'
+    return re.compile(f'[^a-zA-Z0-9\\s{re.escape(keep_chars)}]')
+
+
+@functools.lru_cache(maxsize=32)
+def _special_chars_table(keep_chars: str) -> bytes:
+    """
+    bytes.translate() table for remove_special_characters on ASCII text.
     
-    return re.sub(pattern, ' ', text)
+    Built from the same pattern, so every ASCII character the regex would
+    replace maps to a space and every other byte maps to itself.
+    """
+    pattern = _special_chars_re(keep_chars)
+    return bytes(
+        0x20 if c < 128 and pattern.match(chr(c)) else c
+        for c in range(256)
+    )
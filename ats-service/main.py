@@ -56,20 +56,33 @@ Architecture:
 - app/models/: Data schemas (response structure)
 """
 
+import os
+
 from app import create_app
 
-# Create FastAPI application
-app = create_app()
+# Worker processes; parsing is CPU-bound, so use one per core in production
+WORKERS = int(os.environ.get('ATS_WORKERS', '1'))
 
 # Run server when executed directly
 if __name__ == '__main__':
     import uvicorn
     
     # Start server on all interfaces (0.0.0.0) port 8000
-    # This allows the service to accept requests from other services
+    # This allows the service to accept requests from other services.
+    # uvicorn picks uvloop and httptools automatically when installed
+    # (both come with uvicorn[standard]).
     uvicorn.run(
-        app,
+        # With several workers each process calls the factory itself, so the
+        # launcher never loads NLP resources (or an SBERT model) of its own
+        'app:create_app' if WORKERS > 1 else create_app(),
+        factory=WORKERS > 1,
         host='0.0.0.0',  # Listen on all network interfaces
         port=8000,       # Port number
+        workers=WORKERS, # Worker processes
         log_level='info' # Logging level
     )
+elif __name__ != '__mp_main__':
+    # Imported by a server, e.g. `uvicorn main:app`. Worker processes spawned
+    # above re-import this file as __mp_main__ and build their app through the
+    # factory instead.
+    app = create_app()
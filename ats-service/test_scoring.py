@@ -1,41 +1,48 @@
+import os
 import sys
 sys.path.insert(0, '.')
 
 from pdfminer.high_level import extract_text
-from app.services.parser import find_section, extract_contact_info, preprocess_pdf_text
+from app.services.parser import split_sections, extract_contact_info, preprocess_pdf_text
 from app.services.scorer import compute_heuristics, normalize_score
 
-pdf_path = r'C:\Users\Lenovo\Documents\Shubhranshu Resume.pdf'
-text = extract_text(pdf_path)
-processed = preprocess_pdf_text(text)
 
-# Find sections
-education = find_section(processed, ['education'])
-experience = find_section(processed, ['experience', 'work experience', 'professional experience'])
-skills = find_section(processed, ['skills', 'technical skills'])
-projects = find_section(processed, ['projects', 'personal projects', 'side projects'])
+def main():
+    # Resume to score, e.g. ATS_TEST_PDF=resume.pdf python test_scoring.py
+    pdf_path = os.environ.get('ATS_TEST_PDF')
+    if not pdf_path:
+        print('Set ATS_TEST_PDF to the path of a resume PDF')
+        return
+    
+    text = extract_text(pdf_path)
+    processed = preprocess_pdf_text(text)
+    
+    # Find sections (one preprocessing pass for all of them)
+    parsed_sections = split_sections(processed, {
+        'education': ['education'],
+        'experience': ['experience', 'work experience', 'professional experience'],
+        'skills': ['skills', 'technical skills'],
+        'projects': ['projects', 'personal projects', 'side projects']
+    })
+    
+    print('=== NEW EQUAL SCORING (5 sections x 10 pts each) ===')
+    heuristic_score, feedback, breakdown = compute_heuristics(text, parsed_sections, [])
+    
+    print(f"Education:  {breakdown['education']}/10")
+    print(f"Experience: {breakdown['experience']}/10")
+    print(f"Skills:     {breakdown['skills']}/10")
+    print(f"Projects:   {breakdown['projects']}/10")
+    print(f"Contact:    {breakdown['contact']}/10")
+    print(f"---")
+    print(f"Heuristic Total: {heuristic_score}/50")
+    
+    final_score, sb = normalize_score(heuristic_score, None)
+    print(f"FINAL ATS SCORE: {final_score}/100 (max 98)")
+    print()
+    print("=== FEEDBACK ===")
+    for f in feedback:
+        print(f"- {f}")
 
-parsed_sections = {
-    'education': education,
-    'experience': experience,
-    'skills': skills,
-    'projects': projects
-}
 
-print('=== NEW EQUAL SCORING (5 sections x 10 pts each) ===')
-heuristic_score, feedback, breakdown = compute_heuristics(text, parsed_sections, [])
-
-print(f"Education:  {breakdown['education']}/10")
-print(f"Experience: {breakdown['experience']}/10")
-print(f"Skills:     {breakdown['skills']}/10")
-print(f"Projects:   {breakdown['projects']}/10")
-print(f"Contact:    {breakdown['contact']}/10")
-print(f"---")
-print(f"Heuristic Total: {heuristic_score}/50")
-
-final_score, sb = normalize_score(heuristic_score, None)
-print(f"FINAL ATS SCORE: {final_score}/100 (max 98)")
-print()
-print("=== FEEDBACK ===")
-for f in feedback:
-    print(f"- {f}")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Tests for the resume-wide skill scan in app.services.extractor.
+
+Run from ats-service/ with: python -m unittest discover tests
+"""
+
+import unittest
+
+from app.services import extractor
+from app.services.extractor import extract_skills_from_resume
+
+# 'İ' lowercases to two characters, shifting every later offset
+TURKISH_RESUME = (
+    "Ahmet Yılmaz, İstanbul\n"
+    "Skills: Python, Docker\n"
+    "İzmir office: Python, Docker, AWS\n"
+    "İİ Python Docker AWS\n"
+    "Projects in Python"
+)
+
+
+class ExtractSkillsFromResumeTest(unittest.TestCase):
+    
+    def _both_paths(self, text):
+        """Results with pyahocorasick (if installed) and with the regex fallback."""
+        results = []
+        automaton = extractor._SKILL_AUTOMATON
+        try:
+            for candidate in (automaton, None):
+                extractor._SKILL_AUTOMATON = candidate
+                results.append(extract_skills_from_resume(text))
+        finally:
+            extractor._SKILL_AUTOMATON = automaton
+        return results
+    
+    def test_keeps_original_casing(self):
+        for skills in self._both_paths("I developed a React app using Python and AWS"):
+            self.assertEqual(sorted(skills), ['AWS', 'Python', 'React'])
+    
+    def test_length_changing_lowercase(self):
+        for skills in self._both_paths(TURKISH_RESUME):
+            self.assertEqual(skills, ['Python', 'Docker', 'AWS'])
+    
+    def test_one_entry_per_skill(self):
+        for skills in self._both_paths("Python, python, PYTHON and React Native"):
+            self.assertEqual(sorted(skills), ['Python', 'React', 'React Native'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests for the SBERT embedding cache in app.services.scorer.
+
+Run from ats-service/ with: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+from app.services.scorer import _encode_normalized
+
+
+class _FakeModel:
+    """encode() returns the same unit vector for every text."""
+    
+    def __init__(self, axis: int):
+        self.axis = axis
+    
+    def encode(self, sentences, **kwargs):
+        vectors = np.zeros((len(sentences), 2), dtype=np.float32)
+        vectors[:, self.axis] = 1.0
+        return vectors
+
+
+class EncodeNormalizedCacheTest(unittest.TestCase):
+    
+    def test_replaced_model_does_not_reuse_embeddings(self):
+        # The replacement usually gets the freed model's id()
+        first = _FakeModel(0)
+        np.testing.assert_array_equal(_encode_normalized(first, ['python developer']), [[1, 0]])
+        del first
+        
+        second = _FakeModel(1)
+        np.testing.assert_array_equal(_encode_normalized(second, ['python developer']), [[0, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()